@@ -0,0 +1,133 @@
+"""
+스타일시트 묶음 (프로세스당 한 번 읽기/병합/압축, 파일 mtime이 바뀔 때만 다시 만듦)
+
+static/의 CSS를 하나로 합쳐 내용 해시가 붙은 파일(static/dist/styles.<해시>.css)로 쓰고,
+화면에는 <link> 한 줄만 보냅니다. 파일은 컴포넌트 정적 경로로 서빙되어
+Content-Type: text/css, Cache-Control: public 으로 브라우저가 캐시합니다.
+(Streamlit의 server.enableStaticServing은 .css를 text/plain + nosniff로 보내 스타일시트로 쓸 수 없음)
+파일을 쓸 수 없는 환경에서는 압축된 CSS를 <style>로 넣습니다.
+"""
+import hashlib
+import os
+import re
+import time
+
+import streamlit as st
+import streamlit.components.v1 as components
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_DIST_DIR = os.path.join(_ROOT, "static", "dist")
+
+# 적용 순서대로 (뒤의 규칙이 앞의 규칙을 덮어씀)
+STYLESHEETS = ("static/styles.css", "static/main.css")
+
+# 그대로 둘 부분: 문자열 리터럴, 따옴표 없는 url(...) / 지울 부분: 주석
+_STRING_OR_COMMENT = re.compile(
+    r'("(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\'|\burl\(\s*[^\s"\'][^)]*\))|/\*.*?\*/',
+    re.S | re.I,
+)
+_WHITESPACE = re.compile(r"\s+")
+_SPACE_AROUND = re.compile(r"\s*([{};,>])\s*")
+_SPACE_AFTER_COLON = re.compile(r":\s+")
+
+# static/dist 를 컴포넌트 정적 경로로 등록 (화면에 그리지 않고 파일 서빙에만 사용)
+try:
+    os.makedirs(_DIST_DIR, exist_ok=True)
+    _ASSET_URL = "component/" + components.declare_component("assets", path=_DIST_DIR).name
+except OSError:
+    _ASSET_URL = None
+
+# 이전 묶음 보관 기간 (초) - 다른 프로세스나 열려 있는 탭이 아직 참조할 수 있으므로 바로 지우지 않음
+BUNDLE_MAX_AGE = 24 * 60 * 60
+
+# {(경로, mtime) 튜플: (url, css)} - 가장 최근 것 하나만 보관
+_bundle_cache = {}
+
+
+def minify_css(css):
+    """주석/불필요한 공백 제거 (문자열 리터럴과 url(...) 안은 그대로 둠)"""
+    out = []
+    pos = 0
+    for match in _STRING_OR_COMMENT.finditer(css):
+        out.append(_minify_chunk(css[pos:match.start()]))
+        out.append(match.group(1) or "")
+        pos = match.end()
+    out.append(_minify_chunk(css[pos:]))
+    return "".join(out).strip()
+
+
+def _minify_chunk(chunk):
+    chunk = _WHITESPACE.sub(" ", chunk)
+    chunk = _SPACE_AROUND.sub(r"\1", chunk)
+    return _SPACE_AFTER_COLON.sub(":", chunk).replace(";}", "}")
+
+
+def _write_bundle(css):
+    """내용 해시 파일명으로 저장 (BUNDLE_MAX_AGE보다 오래 쓰이지 않은 이전 묶음은 삭제) -> 파일명"""
+    name = f"styles.{hashlib.sha256(css.encode('utf-8')).hexdigest()[:12]}.css"
+    os.makedirs(_DIST_DIR, exist_ok=True)
+    path = os.path.join(_DIST_DIR, name)
+    if os.path.exists(path):
+        # 지금 쓰는 묶음이 오래된 것으로 지워지지 않도록 mtime 갱신
+        os.utime(path)
+    else:
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(css)
+        os.replace(tmp, path)
+    _prune_bundles(keep=name)
+    return name
+
+
+def _prune_bundles(keep):
+    cutoff = time.time() - BUNDLE_MAX_AGE
+    for old in os.listdir(_DIST_DIR):
+        if not (old.startswith("styles.") and old.endswith(".css")) or old == keep:
+            continue
+        path = os.path.join(_DIST_DIR, old)
+        try:
+            if os.stat(path).st_mtime < cutoff:
+                os.remove(path)
+        except OSError:
+            pass
+
+
+def _bundle_exists(url):
+    """묶음 파일이 남아 있는지 (다른 프로세스가 오래된 묶음으로 지웠으면 False, <style> 방식이면 True)"""
+    return url is None or os.path.exists(os.path.join(_DIST_DIR, url.rsplit("/", 1)[1]))
+
+
+def css_bundle(paths=STYLESHEETS):
+    """
+    (url, 압축된 CSS) - 원본 파일의 mtime이 그대로이고 묶음 파일이 남아 있으면 다시 읽지 않음
+    url은 묶음 파일을 쓸 수 없으면 None
+    """
+    files = tuple(os.path.join(_ROOT, p) for p in paths)
+    key = tuple((f, os.stat(f).st_mtime_ns) for f in files)
+    cached = _bundle_cache.get(key)
+    if cached is not None and _bundle_exists(cached[0]):
+        return cached
+
+    parts = []
+    for f in files:
+        with open(f, encoding="utf-8") as src:
+            parts.append(src.read())
+    css = minify_css("\n".join(parts))
+    url = None
+    if _ASSET_URL is not None:
+        try:
+            url = f"{_ASSET_URL}/{_write_bundle(css)}"
+        except OSError:
+            pass
+    _bundle_cache.clear()
+    _bundle_cache[key] = (url, css)
+    return url, css
+
+
+def inject_styles():
+    """공통 스타일시트 적용 (<link> 한 줄, 묶음 파일이 없으면 <style>)"""
+    url, css = css_bundle()
+    if url is None:
+        st.markdown(f"<style>{css}</style>", unsafe_allow_html=True)
+    else:
+        st.markdown(f'<link rel="stylesheet" href="{url}">', unsafe_allow_html=True)
@@ -0,0 +1,343 @@
+"""
+일용근로자 일괄 판단 (명령행, streamlit 비의존)
+
+근무 기록 CSV(한 줄 = 근로자 1명의 근무일 하루)를 읽어 근로자별로
+조건 1/2와 가장 빠른 신청 가능일을 판단 엔진(app.eligibility_engine)으로 계산합니다.
+
+    python -m app.batch daily-worker input.csv --base-date 2025-03-10 -o result.csv
+
+입력은 행 단위로 흘려보내며(generator 파이프라인) 근로자 한 명씩 판단하므로
+최대 메모리가 파일 크기와 무관합니다.
+- 기본: 근로자 ID(문자열) 오름차순으로 정렬된 입력을 가정하고, 순서가 어긋나면 ValueError
+- --sort: 정렬되지 않은 입력을 SORT_CHUNK_ROWS행씩 정렬해 임시 파일에 쓰고 heapq.merge로 병합(외부 정렬)
+출력 형식은 --format 또는 출력 파일 확장자(.csv/.jsonl)로 정합니다.
+"""
+import argparse
+import csv
+import heapq
+import json
+import os
+import sys
+import tempfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from itertools import groupby, islice
+
+from app.date_kernel import first_day_of_prev_month, to_date, today_kst
+from app.eligibility_engine import evaluate
+from app.holiday_calendar import business_days_between
+
+# 프로세스 하나에 한 번에 넘기는 근로자 수
+BATCH_SIZE = 500
+# 프로세스당 동시에 대기시키는 묶음 수 (메모리 상한)
+MAX_PENDING_PER_JOB = 2
+# 외부 정렬 시 메모리에서 한 번에 정렬하는 행 수
+SORT_CHUNK_ROWS = 200_000
+
+RESULT_FIELDS = [
+    "worker_id",
+    "base_date",
+    "worked_days",
+    "total_days",
+    "condition1",
+    "condition2",
+    "general_eligible",
+    "construction_eligible",
+    "earliest_condition1",
+    "earliest_condition2",
+    # 기준 날짜 다음 날 ~ 가장 빠른 신청 가능일의 영업일 수 (이미 충족이면 0, 날짜가 없으면 빈 값)
+    "condition1_business_days",
+    "condition2_business_days",
+    "last_worked",
+]
+
+
+def read_rows(stream, id_column, date_column):
+    """CSV 행 -> (근로자 ID, 근무일) 스트림. 날짜 형식이 잘못되면 ValueError (줄 번호 포함)"""
+    reader = csv.DictReader(stream)
+    missing = {id_column, date_column} - set(reader.fieldnames or ())
+    if missing:
+        raise ValueError(f"입력 CSV에 열이 없습니다: {', '.join(sorted(missing))}")
+    for row in reader:
+        worker_id, value = row[id_column], row[date_column]
+        # 열 수가 머리글보다 적은 행은 DictReader가 None을 채움
+        if worker_id is None or not worker_id.strip() or value is None:
+            raise ValueError(f"{reader.line_num}행: 근로자 ID 또는 근무일이 없습니다")
+        try:
+            yield worker_id, to_date(value.strip())
+        except (TypeError, ValueError):
+            raise ValueError(f"{reader.line_num}행: 잘못된 날짜 '{value}'") from None
+
+
+def check_sorted(rows):
+    """근로자 ID 오름차순인지 확인하면서 그대로 흘려보냄 (직전 ID 하나만 기억)"""
+    prev = None
+    for row in rows:
+        if prev is not None and row[0] < prev:
+            raise ValueError(
+                f"근로자 ID '{row[0]}'가 '{prev}' 뒤에 나옵니다. "
+                "근로자 ID 순으로 정렬하거나 --sort 옵션을 사용해 주세요."
+            )
+        prev = row[0]
+        yield row
+
+
+def _write_run(rows):
+    run = tempfile.TemporaryFile("w+", newline="", encoding="utf-8")
+    csv.writer(run).writerows((worker_id, d.toordinal()) for worker_id, d in rows)
+    run.seek(0)
+    return run
+
+
+def _read_run(run):
+    for worker_id, ordinal in csv.reader(run):
+        yield worker_id, date.fromordinal(int(ordinal))
+
+
+def external_sort(rows, chunk_rows=SORT_CHUNK_ROWS):
+    """
+    (근로자 ID, 근무일) 스트림 -> (근로자 ID, 근무일) 오름차순 스트림
+    chunk_rows행씩 정렬한 임시 파일들을 heapq.merge로 병합 (메모리는 chunk_rows에 비례)
+    chunk_rows가 1보다 작으면 ValueError (호출 즉시)
+    """
+    if chunk_rows < 1:
+        raise ValueError(f"외부 정렬 단위 행 수는 1 이상이어야 합니다: {chunk_rows}")
+    return _merge_sorted_runs(rows, chunk_rows)
+
+
+def _merge_sorted_runs(rows, chunk_rows):
+    runs = []
+    try:
+        for chunk in _batches(rows, chunk_rows):
+            chunk.sort()
+            runs.append(_write_run(chunk))
+            del chunk  # 다음 묶음을 읽기 전에 해제
+        yield from heapq.merge(*map(_read_run, runs))
+    finally:
+        for run in runs:
+            run.close()
+
+
+def group_by_worker(rows, base_date):
+    """
+    근로자 ID 순 (근로자 ID, 근무일) 스트림 -> (근로자 ID, 판단 기간 안의 근무일 튜플)
+    """
+    start = first_day_of_prev_month(base_date)
+    for worker_id, group in groupby(rows, key=lambda row: row[0]):
+        yield worker_id, tuple(d for _, d in group if start <= d <= base_date)
+
+
+def business_days_after(base_date, day):
+    """기준 날짜 다음 날 ~ day(포함)의 영업일 수 (day가 None이면 None)"""
+    return None if day is None else business_days_between(base_date.toordinal() + 1, day)
+
+
+def result_row(worker_id, result, business_days=None):
+    """
+    EligibilityResult -> 출력용 dict (날짜는 YYYY-MM-DD, 없으면 빈 값)
+    business_days: 미리 계산한 (조건 1, 조건 2) 영업일 수 - 없으면 여기서 계산
+    """
+    if business_days is None:
+        business_days = (
+            business_days_after(result.base_date, result.earliest_condition1),
+            business_days_after(result.base_date, result.earliest_condition2),
+        )
+    return {
+        "worker_id": worker_id,
+        "base_date": result.base_date.isoformat(),
+        "worked_days": result.worked_days,
+        "total_days": result.total_days,
+        "condition1": result.condition1,
+        "condition2": result.condition2,
+        "general_eligible": result.general_eligible,
+        "construction_eligible": result.construction_eligible,
+        "earliest_condition1": result.earliest_condition1.isoformat() if result.earliest_condition1 else None,
+        "earliest_condition2": result.earliest_condition2.isoformat() if result.earliest_condition2 else None,
+        "condition1_business_days": business_days[0],
+        "condition2_business_days": business_days[1],
+        "last_worked": result.last_worked.isoformat() if result.last_worked else None,
+    }
+
+
+def evaluate_batch(batch, base_date):
+    """[(근로자 ID, 근무일 튜플), ...] -> 출력용 dict 리스트 (프로세스 풀에서 실행)"""
+    return [result_row(worker_id, evaluate(dates, base_date)) for worker_id, dates in batch]
+
+
+def evaluate_batch_vectorized(batch, base_date):
+    """evaluate_batch와 같은 결과를 근로자 × 날짜 행렬 연산으로 계산 (numpy 필요)"""
+    import numpy as np
+
+    from app.cohort import NO_DATE, cohort_matrix, evaluate_cohort
+    from app.holiday_calendar import business_day_counts
+
+    cohort = evaluate_cohort(cohort_matrix([dates for _, dates in batch], base_date), base_date)
+    start = np.full(len(cohort), base_date.toordinal() + 1, dtype=np.int64)
+    business_days = [
+        [None if day == NO_DATE else n for day, n in zip(earliest.tolist(), business_day_counts(start, earliest).tolist())]
+        for earliest in (cohort.earliest_condition1, cohort.earliest_condition2)
+    ]
+    return [
+        result_row(worker_id, result, counts)
+        for (worker_id, _), result, counts in zip(batch, cohort.results(), zip(*business_days))
+    ]
+
+
+def _batches(items, size):
+    it = iter(items)
+    while batch := list(islice(it, size)):
+        yield batch
+
+
+def screen_daily_workers(workers, base_date, jobs=1, vectorized=False):
+    """
+    (근로자 ID, 근무일) 묶음 스트림 -> 출력용 dict 스트림 (입력 순서 유지)
+    BATCH_SIZE명씩 계산하며, jobs > 1이면 묶음을 프로세스 풀에 나눠 보냅니다.
+    대기 중인 묶음은 jobs * MAX_PENDING_PER_JOB개까지만 두므로 입력을 미리 다 읽지 않습니다.
+    vectorized면 BATCH_SIZE명씩 행렬로 묶어 app.cohort로 계산합니다.
+    """
+    evaluate_fn = evaluate_batch_vectorized if vectorized else evaluate_batch
+    if jobs <= 1:
+        for batch in _batches(workers, BATCH_SIZE):
+            yield from evaluate_fn(batch, base_date)
+        return
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        pending = deque()
+        for batch in _batches(workers, BATCH_SIZE):
+            pending.append(pool.submit(evaluate_fn, batch, base_date))
+            if len(pending) >= jobs * MAX_PENDING_PER_JOB:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+class CsvWriter:
+    def __init__(self, stream):
+        self.writer = csv.DictWriter(stream, fieldnames=RESULT_FIELDS)
+        self.writer.writeheader()
+
+    def write(self, row):
+        self.writer.writerow({k: "" if v is None else v for k, v in row.items()})
+
+
+class JsonlWriter:
+    def __init__(self, stream):
+        self.stream = stream
+
+    def write(self, row):
+        self.stream.write(json.dumps(row, ensure_ascii=False) + "\n")
+
+
+WRITERS = {"csv": CsvWriter, "jsonl": JsonlWriter}
+
+
+def _output_format(args):
+    if args.format:
+        return args.format
+    if args.output and args.output.lower().endswith(".jsonl"):
+        return "jsonl"
+    return "csv"
+
+
+def _current_umask():
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+def _temporary_output(path):
+    try:
+        return tempfile.NamedTemporaryFile(
+            "w",
+            newline="",
+            encoding="utf-8",
+            dir=os.path.dirname(os.path.abspath(path)),
+            prefix=".batch-",
+            suffix=".tmp",
+            delete=False,
+        )
+    except OSError as e:
+        raise OSError(f"결과 파일을 만들 수 없습니다: {path} ({e.strerror})") from None
+
+
+def run_daily_worker(args):
+    base_date = to_date(args.base_date) if args.base_date else today_kst()
+    if args.vectorized:
+        try:
+            import app.cohort  # noqa: F401
+        except ImportError:
+            sys.exit("--vectorized 옵션에는 numpy가 필요합니다 (pip install numpy)")
+    writer_cls = WRITERS[_output_format(args)]
+    with open(args.input, newline="", encoding=args.encoding) as src:
+        # 결과 파일은 같은 폴더의 임시 파일에 쓰고 끝까지 성공했을 때만 바꿔 넣음 (실패 시 반쯤 쓴 파일이 남지 않음)
+        out = _temporary_output(args.output) if args.output else sys.stdout
+        try:
+            writer = writer_cls(out)
+            rows = read_rows(src, args.id_column, args.date_column)
+            rows = external_sort(rows, args.chunk_rows) if args.sort else check_sorted(rows)
+            workers = group_by_worker(rows, base_date)
+            count = 0
+            for row in screen_daily_workers(workers, base_date, jobs=args.jobs, vectorized=args.vectorized):
+                writer.write(row)
+                count += 1
+        except BaseException:
+            if out is not sys.stdout:
+                out.close()
+                os.remove(out.name)
+            raise
+        if out is not sys.stdout:
+            out.close()
+            # 임시 파일은 0600으로 만들어지므로 open()으로 직접 쓴 것처럼 umask를 따르게 함
+            os.chmod(out.name, 0o666 & ~_current_umask())
+            os.replace(out.name, args.output)
+    print(f"{count}명 판단 완료 (기준 날짜 {base_date})", file=sys.stderr)
+
+
+def positive_int(value):
+    """argparse type: 1 이상의 정수"""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"정수가 아닙니다: '{value}'") from None
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"1 이상이어야 합니다: {number}")
+    return number
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m app.batch", description="실업급여 자격 일괄 판단")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    daily = sub.add_parser("daily-worker", help="일용근로자 조건 1/2 일괄 판단")
+    daily.add_argument("input", help="근무 기록 CSV (근로자 ID 순으로 정렬, 아니면 --sort)")
+    daily.add_argument("--base-date", help="기준(신청) 날짜 YYYY-MM-DD (기본: 오늘)")
+    daily.add_argument("-o", "--output", help="결과 파일 (기본: 표준 출력)")
+    daily.add_argument("--format", choices=sorted(WRITERS), help="결과 형식 (기본: 출력 파일 확장자, 없으면 csv)")
+    daily.add_argument("--id-column", default="worker_id", help="근로자 ID 열 이름 (기본: worker_id)")
+    daily.add_argument("--date-column", default="work_date", help="근무일 열 이름 (기본: work_date)")
+    daily.add_argument("--encoding", default="utf-8-sig", help="입력 파일 인코딩 (기본: utf-8-sig)")
+    daily.add_argument("--sort", action="store_true", help="정렬되지 않은 입력을 임시 파일로 외부 정렬")
+    daily.add_argument("--chunk-rows", type=positive_int, default=SORT_CHUNK_ROWS, help=f"외부 정렬 단위 행 수 (기본: {SORT_CHUNK_ROWS})")
+    daily.add_argument("--vectorized", action="store_true", help="근로자 묶음을 NumPy 행렬로 한 번에 계산")
+    daily.add_argument("-j", "--jobs", type=positive_int, default=1, help="프로세스 수 (큰 파일용, 기본: 1)")
+    daily.set_defaults(func=run_daily_worker)
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    try:
+        args.func(args)
+    except BrokenPipeError:
+        # 표준 출력을 head 등이 먼저 닫음: 종료 시 flush 오류가 다시 나지 않도록 /dev/null로 돌리고 조용히 종료
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        sys.exit(1)
+    except (ValueError, OSError, LookupError) as e:
+        # 잘못된 입력 값, 없는/읽을 수 없는 파일, 알 수 없는 --encoding
+        parser.exit(2, f"오류: {e}\n")
+
+
+if __name__ == "__main__":
+    main()
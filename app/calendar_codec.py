@@ -0,0 +1,66 @@
+"""
+달력 데이터를 브라우저/URL로 보내기 위한 압축 인코딩 (streamlit 비의존)
+
+하루를 1비트로 표현하고 base64url(패딩 없음)로 인코딩합니다.
+바이트 안에서는 낮은 비트부터 채웁니다 (JS 쪽 decodeBits와 동일).
+"""
+import base64
+from datetime import datetime, timedelta
+
+from app.date_kernel import first_day_of_prev_month, to_date
+
+
+def pack_bits(bits):
+    """0/1 시퀀스 -> base64url 문자열"""
+    packed = bytearray((len(bits) + 7) // 8)
+    for i, bit in enumerate(bits):
+        if bit:
+            packed[i >> 3] |= 1 << (i & 7)
+    return base64.urlsafe_b64encode(bytes(packed)).decode("ascii").rstrip("=")
+
+
+def unpack_bits(token, length):
+    """base64url 문자열 -> 길이 length의 0/1 bytearray"""
+    packed = base64.b64decode(token + "=" * (-len(token) % 4), altchars=b"-_", validate=True)
+    bits = bytearray(length)
+    for i in range(min(length, len(packed) * 8)):
+        bits[i] = (packed[i >> 3] >> (i & 7)) & 1
+    return bits
+
+
+# URL 토큰으로 받는 기준 날짜의 연도 범위 (근로내역 날짜 인식 범위와 같음)
+TOKEN_YEARS = (1900, 2099)
+
+
+def encode_calendar_token(base_date, selected_dates):
+    """
+    기준 날짜 + 근무일 -> URL용 토큰 "YYYYMMDD.<비트마스크>"
+    비트마스크는 기준 날짜가 속한 달의 직전 달 1일부터 하루 1비트입니다.
+    """
+    start = first_day_of_prev_month(base_date)
+    bits = bytearray((base_date - start).days + 1)
+    for d in selected_dates:
+        i = (to_date(d) - start).days
+        if 0 <= i < len(bits):
+            bits[i] = 1
+    token = base_date.strftime("%Y%m%d")
+    if any(bits):
+        token += "." + pack_bits(bits[:bits.rindex(1) + 1])
+    return token
+
+
+def decode_calendar_token(token):
+    """
+    encode_calendar_token의 역변환 -> (기준 날짜, YYYY-MM-DD 근무일 튜플)
+    형식이 잘못되었거나 연도가 TOKEN_YEARS 밖이면 ValueError
+    """
+    base_str, _, bits_token = token.partition(".")
+    if len(base_str) != 8:
+        raise ValueError(f"잘못된 달력 토큰: {token}")
+    base_date = datetime.strptime(base_str, "%Y%m%d").date()
+    # 0001년처럼 형식만 맞는 날짜는 직전 달/이후 날짜 계산에서 OverflowError가 나므로 미리 거부
+    if not TOKEN_YEARS[0] <= base_date.year <= TOKEN_YEARS[1]:
+        raise ValueError(f"달력 토큰의 연도가 범위({TOKEN_YEARS[0]}~{TOKEN_YEARS[1]}) 밖입니다: {token}")
+    start = first_day_of_prev_month(base_date)
+    bits = unpack_bits(bits_token, (base_date - start).days + 1) if bits_token else b""
+    return base_date, tuple((start + timedelta(days=i)).isoformat() for i, bit in enumerate(bits) if bit)
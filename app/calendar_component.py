@@ -0,0 +1,95 @@
+import os
+from datetime import date, timedelta
+from functools import lru_cache
+
+import streamlit.components.v1 as components
+
+from app.calendar_codec import pack_bits
+from app.holiday_calendar import is_holiday
+
+# app/calendar_frontend/index.html 을 정적 파일로 서빙하는 양방향 컴포넌트
+_FRONTEND_DIR = os.path.join(os.path.dirname(__file__), "calendar_frontend")
+_daily_calendar = components.declare_component("daily_calendar", path=_FRONTEND_DIR)
+
+
+@lru_cache(maxsize=64)
+def calendar_layout(start_date, end_date):
+    """
+    달력을 그리는 데 필요한 최소 정보 (칸은 브라우저가 만듭니다)
+
+    - start: 첫 날짜 (YYYY-MM-DD)
+    - length: 일수
+    - saturday / holiday: 토요일, 휴일(일요일·공휴일) 비트마스크 (app.calendar_codec.pack_bits)
+    """
+    days = [start_date + timedelta(days=i) for i in range((end_date - start_date).days + 1)]
+    return {
+        "start": start_date.isoformat(),
+        "length": len(days),
+        "saturday": pack_bits([d.weekday() == 5 for d in days]),
+        "holiday": pack_bits([d.weekday() == 6 or is_holiday(d) for d in days]),
+    }
+
+
+def calendar_selection(value, start_date, end_date, initial_dates=None):
+    """
+    컴포넌트 값 {"start": 시작일, "days": [시작일 기준 일 오프셋]} -> 기간 안의 선택된 날짜(YYYY-MM-DD) 튜플
+    값이 아직 없으면 initial_dates 기준
+    """
+    if not value:
+        # 브라우저가 아직 값을 보내지 않았으면 initial_dates 기준으로 계산
+        selected = {date.fromisoformat(d) for d in initial_dates or ()}
+    else:
+        origin = date.fromisoformat(value["start"])
+        selected = {origin + timedelta(days=offset) for offset in value["days"]}
+    return tuple(d.isoformat() for d in sorted(selected) if start_date <= d <= end_date)
+
+
+def _delay_overlay(start_date, end_date, costs):
+    # 달력 칸 순서대로 [일반, 건설] 지연 일수 (근무일 등 값이 없는 칸은 null)
+    days = (end_date - start_date).days + 1
+    cells = [costs.get(start_date + timedelta(days=i)) for i in range(days)]
+    return {
+        "general": [c[0] if c else None for c in cells],
+        "construction": [c[1] if c else None for c in cells],
+    }
+
+
+def daily_calendar(
+    start_date,
+    end_date,
+    initial_dates=None,
+    initial_revision=0,
+    delay_costs=None,
+    expanded_months=2,
+    key=None,
+):
+    """
+    근무일 선택 달력을 표시하고 선택된 날짜를 반환합니다.
+
+    - start_date/end_date: 달력에 표시할 기간
+    - initial_dates: 브라우저 저장값 대신 적용할 근무일 (공유 링크 등). 값이 바뀔 때마다 한 번 적용
+    - initial_revision: 같은 initial_dates를 다시 적용하려면 올리는 번호 (파일 불러오기 등)
+    - delay_costs: {date: (일반, 건설) 지연 일수} (app.eligibility_engine.delay_costs), 주어지면 칸마다 표시
+    - expanded_months: 처음부터 칸을 그리는 최근 달 수. 그 이전 달은 근무일 수 요약만 보이고 누르면 펼침
+    - 반환값: 기간 안의 선택된 날짜(YYYY-MM-DD) 튜플, 오름차순
+
+    브라우저는 {"start": 시작일, "days": [시작일 기준 일 오프셋]} 형태로만 값을 보냅니다.
+    """
+    initial = None
+    if initial_dates is not None:
+        # 표시 기간이 아니라 근무일 자체에 고정 -> 기준 날짜를 바꿔도 다시 적용되지 않음
+        days = sorted({date.fromisoformat(d) for d in initial_dates})
+        bits = bytearray((days[-1] - days[0]).days + 1 if days else 0)
+        for d in days:
+            bits[(d - days[0]).days] = 1
+        initial = {"start": days[0].isoformat() if days else None, "bits": pack_bits(bits), "revision": initial_revision}
+
+    value = _daily_calendar(
+        layout=calendar_layout(start_date, end_date),
+        initial=initial,
+        delay=_delay_overlay(start_date, end_date, delay_costs) if delay_costs is not None else None,
+        expanded_months=expanded_months,
+        key=key,
+        default=None,
+    )
+    return calendar_selection(value, start_date, end_date, initial_dates)
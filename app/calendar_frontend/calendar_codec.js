@@ -0,0 +1,31 @@
+// Bit array <-> base64url (no padding, low bit first in each byte); same format as app/calendar_codec.py
+function encodeBits(bits) {
+    const bytes = new Uint8Array((bits.length + 7) >> 3);
+    for (let i = 0; i < bits.length; i++) {
+        if (bits[i]) {
+            bytes[i >> 3] |= 1 << (i & 7);
+        }
+    }
+    let binary = '';
+    for (let i = 0; i < bytes.length; i++) {
+        binary += String.fromCharCode(bytes[i]);
+    }
+    return btoa(binary).replace(/\+/g, '-').replace(/\//g, '_').replace(/=+$/, '');
+}
+
+// length defaults to every bit in the token
+function decodeBits(token, length) {
+    const binary = atob(token.replace(/-/g, '+').replace(/_/g, '/'));
+    if (length === undefined) {
+        length = binary.length * 8;
+    }
+    const bits = new Uint8Array(length);
+    for (let i = 0; i < length && (i >> 3) < binary.length; i++) {
+        bits[i] = (binary.charCodeAt(i >> 3) >> (i & 7)) & 1;
+    }
+    return bits;
+}
+
+if (typeof module !== 'undefined') {
+    module.exports = { encodeBits, decodeBits };
+}
@@ -0,0 +1,148 @@
+// Incremental selection state for the daily-worker calendar (same rules as app/eligibility_engine.py).
+// A per-day bit array with a Fenwick tree answers range counts and the latest worked day in O(log n),
+// and running counters follow the condition 1 period and the 14-day window, so a toggle never rescans.
+const DAY_MS = 86400000;
+const NO_WORK_DAYS = 14;
+const SEARCH_DAYS = 365;
+
+// UTC day number <-> YYYY-MM-DD
+function dayNumber(dateStr) {
+    return Math.round(Date.parse(dateStr) / DAY_MS);
+}
+
+function dayToISO(day) {
+    return new Date(day * DAY_MS).toISOString().slice(0, 10);
+}
+
+// First day of the month before the month of `day`
+function firstDayOfPrevMonth(day) {
+    const date = new Date(day * DAY_MS);
+    return Math.round(Date.UTC(date.getUTCFullYear(), date.getUTCMonth() - 1, 1) / DAY_MS);
+}
+
+function lastDayOfMonth(day) {
+    const date = new Date(day * DAY_MS);
+    return Math.round(Date.UTC(date.getUTCFullYear(), date.getUTCMonth() + 1, 0) / DAY_MS);
+}
+
+class SelectionState {
+    // startDay: day number of index 0, length: number of calendar days (the last one is the base date)
+    constructor(startDay, length) {
+        this.startDay = startDay;
+        this.length = length;
+        this.bits = new Uint8Array(length);
+        this.tree = new Int32Array(length + 1);
+        this.total = 0;
+
+        this.baseIndex = length - 1;
+        this.cond1Start = Math.max(firstDayOfPrevMonth(startDay + this.baseIndex) - startDay, 0);
+        this.windowStart = this.baseIndex - NO_WORK_DAYS;
+        this.cond1Count = 0;   // selected days in [cond1Start, baseIndex]
+        this.windowCount = 0;  // selected days in [baseIndex - 14, baseIndex - 1]
+    }
+
+    // Number of selected days in [0, i)
+    prefix(i) {
+        let sum = 0;
+        for (; i > 0; i -= i & -i) {
+            sum += this.tree[i];
+        }
+        return sum;
+    }
+
+    set(i, on) {
+        const value = on ? 1 : 0;
+        if (this.bits[i] === value) {
+            return;
+        }
+        const delta = on ? 1 : -1;
+        this.bits[i] = value;
+        this.total += delta;
+        for (let j = i + 1; j <= this.length; j += j & -j) {
+            this.tree[j] += delta;
+        }
+        if (i >= this.cond1Start && i <= this.baseIndex) {
+            this.cond1Count += delta;
+        }
+        if (i >= this.windowStart && i < this.baseIndex) {
+            this.windowCount += delta;
+        }
+    }
+
+    toggle(i) {
+        this.set(i, !this.bits[i]);
+        return this.bits[i] === 1;
+    }
+
+    clear() {
+        this.bits.fill(0);
+        this.tree.fill(0);
+        this.total = this.cond1Count = this.windowCount = 0;
+    }
+
+    selectedIndices() {
+        const indices = [];
+        for (let i = 0; i < this.length; i++) {
+            if (this.bits[i]) {
+                indices.push(i);
+            }
+        }
+        return indices;
+    }
+
+    // Index of the latest selected day (-1 if none): Fenwick descent to the total-th selected day
+    lastIndex() {
+        if (this.total === 0) {
+            return -1;
+        }
+        let pos = 0;
+        let remaining = this.total;
+        for (let step = 1 << Math.floor(Math.log2(this.length)); step > 0; step >>= 1) {
+            if (pos + step <= this.length && this.tree[pos + step] < remaining) {
+                pos += step;
+                remaining -= this.tree[pos];
+            }
+        }
+        return pos;
+    }
+
+    // Earliest day after the base date meeting condition 1, assuming no further work (O(months * log n))
+    earliestCondition1() {
+        const base = this.startDay + this.baseIndex;
+        const stop = base + SEARCH_DAYS;
+        let t = base + 1;
+        while (t <= stop) {
+            const periodStart = firstDayOfPrevMonth(t);
+            const worked = this.total - this.prefix(Math.min(Math.max(periodStart - this.startDay, 0), this.length));
+            const candidate = Math.max(t, periodStart + worked * 3);
+            const hi = Math.min(lastDayOfMonth(t), stop);
+            if (candidate <= hi) {
+                return candidate;
+            }
+            t = hi + 1;
+        }
+        return null;
+    }
+
+    summary() {
+        const base = this.startDay + this.baseIndex;
+        const totalDays = this.baseIndex - this.cond1Start + 1;
+        const baseWorked = this.bits[this.baseIndex] === 1;
+        const condition1Met = !baseWorked && this.cond1Count * 3 < totalDays;
+        const condition2Met = !baseWorked && this.windowCount === 0;
+        const last = this.lastIndex();
+        return {
+            worked: this.cond1Count,
+            totalDays: totalDays,
+            threshold: totalDays / 3,
+            condition1Met: condition1Met,
+            condition2Met: condition2Met,
+            earliestCondition1: condition1Met ? base : this.earliestCondition1(),
+            earliestCondition2: condition2Met ? base : this.startDay + last + NO_WORK_DAYS + 1,
+        };
+    }
+}
+
+if (typeof module !== 'undefined') {
+    module.exports = { SelectionState, dayNumber, dayToISO };
+}
@@ -0,0 +1,153 @@
+"""
+일용근로자 여러 명을 한 번에 판단 (NumPy, streamlit 비의존)
+
+근로자 × 날짜 불리언 행렬(열 0 = 기준 날짜가 속한 달의 직전 달 1일, 마지막 열 = 기준 날짜)을
+누적합/구간 연산 몇 번으로 처리합니다. 결과는 근로자마다 app.eligibility_engine.evaluate와 같습니다.
+
+numpy가 필요하므로 일괄 처리(--vectorized)에서만 불러옵니다.
+"""
+from dataclasses import dataclass
+from datetime import date, timedelta
+
+import numpy as np
+
+from app.date_kernel import days_between, first_day_of_prev_month, last_day_of_month, to_date
+from app.eligibility_engine import NO_WORK_DAYS, SEARCH_DAYS, EligibilityResult
+
+# 날짜가 없음을 나타내는 서수 (date.toordinal()은 1부터 시작)
+NO_DATE = 0
+
+
+def cohort_matrix(worked_dates_list, base_date):
+    """
+    근로자별 근무일 목록 -> (근로자 수, 판단 기간 일수) bool 행렬
+    판단 기간 밖의 날짜는 무시합니다.
+    """
+    base_date = to_date(base_date)
+    start = first_day_of_prev_month(base_date).toordinal()
+    length = base_date.toordinal() - start + 1
+    matrix = np.zeros((len(worked_dates_list), length), dtype=bool)
+    for row, worked_dates in zip(matrix, worked_dates_list):
+        offsets = [to_date(d).toordinal() - start for d in worked_dates]
+        row[[i for i in offsets if 0 <= i < length]] = True
+    return matrix
+
+
+@dataclass(frozen=True, slots=True)
+class CohortResult:
+    """
+    근로자별 판단 결과 배열 (길이 = 근로자 수)
+
+    날짜는 date.toordinal() 서수이며, 없으면 NO_DATE입니다.
+    """
+
+    base_date: date
+    total_days: int
+    worked_days: np.ndarray
+    condition1: np.ndarray
+    condition2: np.ndarray
+    earliest_condition1: np.ndarray
+    earliest_condition2: np.ndarray
+    last_worked: np.ndarray
+    base_worked: np.ndarray
+
+    def __len__(self):
+        return len(self.worked_days)
+
+    def results(self):
+        """근로자별 EligibilityResult 리스트"""
+
+        def as_date(ordinal):
+            return date.fromordinal(ordinal) if ordinal != NO_DATE else None
+
+        return [
+            EligibilityResult(
+                base_date=self.base_date,
+                worked_days=worked,
+                total_days=self.total_days,
+                condition1=cond1,
+                condition2=cond2,
+                earliest_condition1=as_date(e1),
+                earliest_condition2=as_date(e2),
+                last_worked=as_date(last),
+                base_worked=base_worked,
+            )
+            for worked, cond1, cond2, e1, e2, last, base_worked in zip(
+                self.worked_days.tolist(),
+                self.condition1.tolist(),
+                self.condition2.tolist(),
+                self.earliest_condition1.tolist(),
+                self.earliest_condition2.tolist(),
+                self.last_worked.tolist(),
+                self.base_worked.tolist(),
+            )
+        ]
+
+
+def _earliest_condition1(prefix, start, base_date, pending, limit):
+    """
+    기준 날짜 다음 날부터 조건 1을 처음 충족하는 날짜 서수 (이후 근무 없음 전제)
+    달마다 근무일 수가 고정이므로 근무일 수 * 3 < 기간 일수를 만족하는 첫 날을 한 번에 계산합니다.
+    """
+    worked_total = prefix[:, -1]
+    found = np.full(len(prefix), NO_DATE, dtype=np.int64)
+    t = base_date + timedelta(days=1)
+    stop = base_date + timedelta(days=limit)
+    while t <= stop and pending.any():
+        hi = min(last_day_of_month(t), stop)
+        period_start = first_day_of_prev_month(t)
+        # 기간 시작일 ~ 기준 날짜 근무일 수 (기준 날짜 이후 근무 없음)
+        i = min(max(period_start.toordinal() - start.toordinal(), 0), prefix.shape[1] - 1)
+        worked = worked_total - prefix[:, i]
+        candidate = np.maximum(t.toordinal(), period_start.toordinal() + worked * 3)
+        hit = pending & (candidate <= hi.toordinal())
+        found[hit] = candidate[hit]
+        pending = pending & ~hit
+        t = hi + timedelta(days=1)
+    return found
+
+
+def evaluate_cohort(matrix, base_date, limit=SEARCH_DAYS):
+    """
+    근로자 × 날짜 bool 행렬 -> CohortResult
+    (행마다 app.eligibility_engine.evaluate(근무일, base_date)와 같은 결과)
+    """
+    base_date = to_date(base_date)
+    start = first_day_of_prev_month(base_date)
+    total_days = days_between(start, base_date)
+    matrix = np.asarray(matrix, dtype=bool)
+    if matrix.ndim != 2 or matrix.shape[1] != total_days:
+        raise ValueError(f"행렬은 (근로자 수, {total_days}) 형태여야 합니다: {matrix.shape}")
+
+    prefix = np.zeros((matrix.shape[0], total_days + 1), dtype=np.int64)
+    np.cumsum(matrix, axis=1, out=prefix[:, 1:])
+    worked_days = prefix[:, -1]
+    base_worked = matrix[:, -1]
+
+    # 조건 2: 직전 14일간 근무일 수 (기간 길이는 항상 29일 이상)
+    recent = prefix[:, -2] - prefix[:, -2 - NO_WORK_DAYS]
+    condition1 = ~base_worked & (worked_days * 3 < total_days)
+    condition2 = ~base_worked & (recent == 0)
+
+    any_work = worked_days > 0
+    last_index = total_days - 1 - np.argmax(matrix[:, ::-1], axis=1)
+    last_worked = np.where(any_work, start.toordinal() + last_index, NO_DATE)
+
+    base = base_date.toordinal()
+    earliest1 = np.full(len(matrix), base, dtype=np.int64)
+    not1 = ~condition1
+    earliest1[not1] = _earliest_condition1(prefix, start, base_date, not1, limit)[not1]
+    # 조건 2 불충족이면 직전 14일 또는 당일 근무가 있으므로 마지막 근무일 + 15일이 항상 기준 날짜 이후
+    earliest2 = np.where(condition2, base, last_worked + NO_WORK_DAYS + 1)
+
+    return CohortResult(
+        base_date=base_date,
+        total_days=total_days,
+        worked_days=worked_days,
+        condition1=condition1,
+        condition2=condition2,
+        earliest_condition1=earliest1,
+        earliest_condition2=earliest2,
+        last_worked=last_worked,
+        base_worked=base_worked,
+    )
@@ -1,465 +1,143 @@
 import streamlit as st
-from datetime import datetime, timedelta
-import json
+from datetime import date
 
-def daily_worker_eligibility_app():
-    # Set today's date in KST
-    today_kst = datetime.utcnow() + timedelta(hours=9)
-    input_date = st.date_input("📅 기준 날짜 선택", today_kst.date())
-
-    # Set period for calendar display (from the first day of the previous month to the selected date)
-    first_day_prev_month = (input_date.replace(day=1) - timedelta(days=1)).replace(day=1)
-    
-    cal_dates = []
-    current_date_for_cal = first_day_prev_month
-    while current_date_for_cal <= input_date: # Include up to the selected date
-        cal_dates.append(current_date_for_cal)
-        current_date_for_cal += timedelta(days=1)
-
-    # Group calendar by month
-    calendar_groups = {}
-    for date in cal_dates:
-        ym = date.strftime("%Y-%m")
-        calendar_groups.setdefault(ym, []).append(date)
-
-    # Date data for JavaScript (JSON array string)
-    calendar_dates_json = json.dumps([d.strftime("%Y-%m-%d") for d in cal_dates])
-    
-    # 14 days prior date needed for Condition 2 calculation (depends on the base date)
-    fourteen_days_prior_end = (input_date - timedelta(days=1)).strftime("%Y-%m-%d")
-    fourteen_days_prior_start = (input_date - timedelta(days=14)).strftime("%Y-%m-%d")
-    
-    input_date_str = input_date.strftime("%Y-%m-%d")
-
-    # Streamlit HTML/JavaScript component insertion
-    calendar_html = "<div id='calendar-container'>"
-
-    # Add the Clear Calendar button here, above the month headers
-    calendar_html += """
-    <div style="text-align: right; margin-bottom: 15px;">
-        <button onclick="clearCalendar()" style="
-            background-color: #3F51B5; /* Changed from red to indigo blue */
-            color: white;
-            padding: 10px 20px;
-            border: none;
-            border-radius: 5px;
-            cursor: pointer;
-            font-size: 16px;
-            box-shadow: 0 2px 5px rgba(0,0,0,0.2);
-            transition: background-color 0.2s;
-        " onmouseover="this.style.backgroundColor='#303F9F'" onmouseout="this.style.backgroundColor='#3F51B5'">
-            🔄 달력 초기화
-        </button>
-    </div>
-    """
-
-    for ym, dates in calendar_groups.items():
-        year, month = ym.split("-")
-        calendar_html += f"<h4>{year}년 {month}월</h4>"
-        calendar_html += """
-        <div class="calendar">
-            <div class="day-header sunday">일</div>
-            <div class="day-header">월</div>
-            <div class="day-header">화</div>
-            <div class="day-header">수</div>
-            <div class="day-header">목</div>
-            <div class="day-header">금</div>
-            <div class="day-header saturday">토</div>
-        """
-        # Fill empty days for the first week of the month
-        start_day_offset = (dates[0].weekday() + 1) % 7 # weekday(): Mon0~Sun6 -> Sun0~Sat6
-        for _ in range(start_day_offset):
-            calendar_html += '<div class="empty-day"></div>'
-        
-        # Create day buttons
-        for date in dates:
-            wd = date.weekday()
-            extra_cls = ""
-            if wd == 5:
-                extra_cls = "saturday"
-            elif wd == 6:
-                extra_cls = "sunday"
-            day_num = date.day
-            date_str = date.strftime("%m/%d") # MM/DD format (for local storage key and JS)
-            date_full_str = date.strftime("%Y-%m-%d") #YYYY-MM-DD format (for JS calculation)
-            calendar_html += f'<div class="day {extra_cls}" data-date="{date_str}" data-full-date="{date_full_str}" onclick="toggleDate(this)">{day_num}</div>'
-        calendar_html += "</div>"
-
-    calendar_html += """
-    </div>
-    <div id="resultContainer"></div>
-    <style>
-    /* CSS styles */
-    .calendar {
-        display: grid; 
-        grid-template-columns: repeat(7, 44px); /* 40px -> 45px: increased column width */
-        grid-gap: 5px;
-        margin-bottom: 20px; background: #fff; 
-        padding: 10px 1px; /* Maintain 10px top/bottom, 1px left/right */
-        border-radius: 8px;
-        box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-    }
-    .day-header, .empty-day {
-        width: 44px; height: 44px; /* 40px -> 45px: increased header size */
-        line-height: 45px; /* 40px -> 45px: maintain vertical text alignment */
-        text-align: center;
-        font-weight: bold; color: #555;
-    }
-    .day-header.sunday { color: red; }
-    .day-header.saturday { color: blue; }
-    .day.sunday { color: red; }
-    .day.saturday { color: blue; }
-    .day-header { background: #e0e0e0; border-radius: 5px; font-size: 16px; /* 14px -> 16px */ }
-    .empty-day { background: transparent; border: none; }
-    .day {
-        width: 44px; height: 44px; /* 40px -> 45px: increased day cell size */
-        line-height: 45px; /* 40px -> 45px: maintain vertical text alignment */
-        text-align: center;
-        border: 1px solid #ddd; border-radius: 5px; cursor: pointer; user-select: none;
-        transition: background 0.1s ease, border 0.1s ease; font-size: 18px; /* 16px -> 18px */ color: #333;
-    }
-    .day:hover { background: #f0f0f0; }
-    .day.selected { border: 2px solid #2196F3; background: #2196F3; color: #fff; font-weight: bold; }
-    #resultContainer {
-        color: #121212;
-        background: #fff;
-        padding: 15px 20px;
-        border-radius: 8px;
-        box-shadow: 0 0 10px rgba(0,0,0,0.1);
-        font-size: 15px;
-        line-height: 1.6;
-    }
-    #resultContainer h3 { color: #0d47a1; margin-top: 20px; margin-bottom: 10px; }
-    #resultContainer p { margin: 6px 0; }
-
-    /* Adjust spacing between year/month text and calendar container */
-    #calendar-container h4 {
-        margin-bottom: 5px; /* Reduce bottom margin of year/month text to be closer to the calendar. */
-    }
-
-    /* Dark mode styles */
-    html[data-theme="dark"] #resultContainer {
-        background: #262730;
-        color: #FAFAFA;
-    }
-    html[data-theme="dark"] #resultContainer h3 {
-        color: #90CAF9;
-    }
-    /* ★★★ This part has been changed: Force color for year/month text in dark mode ★★★ */
-    html[data-theme="dark"] h4 {
-        color: #FFFFFF !important; /* Set bright color for all h4 and force with !important */
-    }
-    html[data-theme="dark"] .day {
-        background-color: #31333F;
-        color: #FAFAFA;
-        border: 1px solid #4B4B4B;
-    }
-    html[data-theme="dark"] .day:hover {
-        background-color: #45475A;
-    }
-    html[data-theme="dark"] .day.selected {
-        background: #2196F3;
-        color: #fff;
-    }
-    html[data-theme="dark"] .day-header {
-        background: #31333F;
-        color: #BBBBBB;
-    }
-    </style>
-
-    <script>
-    // Python-passed date data (injected as JSON array string)
-    const CALENDAR_DATES_RAW = """ + calendar_dates_json + """;
-    const CALENDAR_DATES = CALENDAR_DATES_RAW.map(dateStr => new Date(dateStr)); 
-
-    // Python-passed base date related strings
-    const FOURTEEN_DAYS_START_STR = '""" + fourteen_days_prior_start + """'; 
-    const FOURTEEN_DAYS_END_STR = '""" + fourteen_days_prior_end + """';    
-    const INPUT_DATE_STR = '""" + input_date_str + """';          
-
-    // --- Helper Functions ---
-    // Calculate days between two dates (inclusive of start and end dates)
-    function getDaysBetween(startDate, endDate) {
-        const start = new Date(startDate);
-        const end = new Date(endDate);
-        if (start > end) return 0;
-        let count = 0;
-        let current = new Date(start); 
-        // Set time to 00:00:00 for accurate date comparison
-        current.setHours(0,0,0,0); 
-        end.setHours(0,0,0,0);
-        while (current <= end) {
-            count++;
-            current.setDate(current.getDate() + 1);
-        }
-        return count;
-    }
-
-    // Get the first day of the month prior to the given date
-    function getFirstDayOfPrevMonth(date) {
-        const d = new Date(date);
-        d.setDate(1); 
-        d.setMonth(d.getMonth() - 1); 
-        return d;
-    }
-
-    // Format Date object toYYYY-MM-DD string
-    function formatDateToYYYYMMDD(date) {
-        const year = date.getFullYear();
-        const month = String(date.getMonth() + 1).padStart(2, '0');
-        const day = String(date.getDate()).padStart(2, '0');
-        return `${year}-${month}-${day}`;
-    }
-
-    // --- Core Logic: Calculation and Result Display ---
-    function calculateAndDisplayResult(selectedMMDD) {
-        // Convert selected MM/DD dates toYYYY-MM-DD format
-        const selectedFullDates = selectedMMDD.map(mmdd => {
-            const foundDate = CALENDAR_DATES_RAW.find(d => d.endsWith(mmdd.replace('/', '-')));
-            return foundDate || '';
-        }).filter(Boolean); // Remove empty strings (if storedDates contained dates not in the current calendar)
-
-        // Find the latest worked day among selected working days (assuming no further work)
-        let latestWorkedDay = null;
-        if (selectedFullDates.length > 0) {
-            latestWorkedDay = selectedFullDates.reduce((maxDate, currentDateStr) => {
-                const currentDate = new Date(currentDateStr);
-                return maxDate === null || currentDate > maxDate ? currentDate : maxDate;
-            }, null);
-        }
-
-        const inputDate = new Date(INPUT_DATE_STR); // User selected base date (today's date)
-        inputDate.setHours(0,0,0,0); // Initialize time
-
-        // --- Special Case 1: No working days selected ---
-        if (selectedFullDates.length === 0) {
-            const finalHtml = `
-                <h3>📌 조건 판단</h3>
-                <p>✅ 조건 1 충족: 근무일 0일 (선택 없음)</p>
-                <p>✅ 조건 2 충족: 근무일 0일 (선택 없음)</p>
-                <h3>📌 최종 판단</h3>
-                <p>✅ 일반일용근로자: 신청 가능</p>
-                <p>✅ 건설일용근로자: 신청 가능</p>
-                <h3>📌 종합 신청 가능일</h3>
-                <p>근무일이 없으므로, 현재(${INPUT_DATE_STR}) 바로 신청 가능합니다.</p>
-                <p>※ 위의 '신청 가능일'은 이후 근로제공이 전혀 없다는 전제 하에 계산된 것이며, 실제 고용센터 판단과는 다를 수 있습니다.</p>
-            `;
-            document.getElementById('resultContainer').innerHTML = finalHtml;
-            return;
-        }
-
-        // --- Special Case 2: Base date (INPUT_DATE_STR) is selected as a working day ---
-        // (If the date selected by the user in the Streamlit date picker is checked as a working day in the calendar)
-        if (selectedFullDates.includes(INPUT_DATE_STR)) {
-            // If base date is a working day, both Condition 1 and 2 are considered unfulfilled (user request)
-            const nextPossibleApplicationDate = new Date(INPUT_DATE_STR);
-            nextPossibleApplicationDate.setDate(nextPossibleApplicationDate.getDate() + 14 + 1); // Base date + 14 days no work + 1 day
+from app.calendar_codec import decode_calendar_token, encode_calendar_token
+from app.calendar_component import calendar_selection, daily_calendar
+from app.date_kernel import first_day_of_months_before, first_day_of_prev_month, today_kst
+from app.date_parser import decode_text, parse_worked_dates, split_by_window
+from app.eligibility_engine import TIMELINE_DAYS, WorkHistory, delay_costs, eligibility_timeline, evaluate
+from app.eligibility_render import render_result_html, render_timeline_html
 
-            const finalHtml = `
-                <h3 style="color: red;">📌 조건 판단</h3>
-                <p style="color: red;">❌ 조건 1 불충족: 기준 날짜(${INPUT_DATE_STR}) 근무로 인한 미충족</p>
-                <p style="color: red;">❌ 조건 2 불충족: 기준 날짜(${INPUT_DATE_STR}) 근무로 인한 미충족</p>
-                <h3 style="color: red;">📌 최종 판단</h3>
-                <p style="color: red;">❌ 일반일용근로자: 신청 불가능</p>
-                <p style="color: red;">❌ 건설일용근로자: 신청 불가능</p>
-                <h3>📌 종합 신청 가능일</h3>
-                <p style="color: red;">기준 날짜(${INPUT_DATE_STR})에 근무 기록이 있으므로 현재 신청 불가능합니다.</p>
-                <p style="color: red;">(이 경우, ${INPUT_DATE_STR}이 마지막 근무일이라면 **${formatDateToYYYYMMDD(nextPossibleApplicationDate)}** 이후 신청 가능) (이후 근로제공이 없다는 전제)</p>
-                <p>※ 위의 '신청 가능일'은 이후 근로제공이 전혀 없다는 전제 하에 계산된 것이며, 실제 고용센터 판단과는 다를 수 있습니다.</p>
-            `;
-            document.getElementById('resultContainer').innerHTML = finalHtml;
-            return;
-        }
 
+@st.cache_data(max_entries=1024, show_spinner=False)
+def calculate_result(input_date_str, selected_dates):
+    """기준 날짜와 선택된 근무일로 조건 판단 결과(EligibilityResult)를 계산합니다."""
+    return evaluate(selected_dates, input_date_str)
 
-        // --- Condition 1 Current Judgment (based on base date) ---
-        const currentPeriodStartForCond1 = getFirstDayOfPrevMonth(inputDate);
-        currentPeriodStartForCond1.setHours(0,0,0,0); // Initialize time
 
-        const currentTotalDaysForCond1 = getDaysBetween(currentPeriodStartForCond1, inputDate);
-        const currentThresholdForCond1 = currentTotalDaysForCond1 / 3;
-        
-        // Calculate actual working days within Condition 1 period for the current base date
-        const actualWorkedDaysForCond1 = selectedFullDates.filter(dateStr => {
-            const date = new Date(dateStr);
-            date.setHours(0,0,0,0); // Initialize time
-            return date >= currentPeriodStartForCond1 && date <= latestWorkedDay; // Count only up to latestWorkedDay (assuming no further work)
-        }).length;
+@st.cache_data(max_entries=1024, show_spinner=False)
+def calculate_timeline(input_date_str, selected_dates, days=TIMELINE_DAYS):
+    """기준 날짜부터 days일 동안 날짜별 (날짜, 조건 1, 조건 2)"""
+    base_date = date.fromisoformat(input_date_str)
+    history = WorkHistory.from_dates(selected_dates, origin=first_day_of_prev_month(base_date), end=base_date)
+    return eligibility_timeline(history, base_date, days)
 
-        const condition1Met = actualWorkedDaysForCond1 < currentThresholdForCond1;
-        let condition1Text = condition1Met
-            ? `✅ 조건 1 충족: 근무일 수(${actualWorkedDaysForCond1}) < 기준(${currentThresholdForCond1.toFixed(1)})`
-            : `❌ 조건 1 불충족: 근무일 수(${actualWorkedDaysForCond1}) ≥ 기준(${currentThresholdForCond1.toFixed(1)})`;
 
-        let nextPossible1Message = "";
-        let nextPossible1Date = null; // Store as Date object
+@st.cache_data(max_entries=256, show_spinner=False)
+def calculate_delay_costs(input_date_str, selected_dates):
+    """빈 날마다 하루 더 근무할 때 {날짜: (일반, 건설) 지연 일수}"""
+    return delay_costs(selected_dates, input_date_str)
 
-        if (!condition1Met) { // If Condition 1 is not met for the current base date, calculate the earliest possible date
-            let testApplicationDate = new Date(inputDate);
-            testApplicationDate.setDate(testApplicationDate.getDate() + 1); // Start checking from tomorrow
-            testApplicationDate.setHours(0,0,0,0); // Initialize time
 
-            let loopCount = 0;
-            const maxLoopDays = 365; // Max search days to prevent infinite loop (generously 1 year)
+# 달력 표시 기간 선택지 (개월, 2 = 직전 달 + 기준 날짜가 속한 달)
+LOOKBACK_OPTIONS = (2, 3, 6, 12)
 
-            while (loopCount < maxLoopDays) {
-                const testPeriodStart = getFirstDayOfPrevMonth(testApplicationDate);
-                testPeriodStart.setHours(0,0,0,0); // Initialize time
 
-                const testTotalDays = getDaysBetween(testPeriodStart, testApplicationDate);
-                
-                // Actual working days within the test period (only reflecting records up to the latest worked day)
-                let effectiveWorkedDaysForCond1Test = 0;
-                if (latestWorkedDay && latestWorkedDay >= testPeriodStart) { // If latestWorkedDay is after the test period start
-                    effectiveWorkedDaysForCond1Test = selectedFullDates.filter(dateStr => {
-                        const date = new Date(dateStr);
-                        date.setHours(0,0,0,0); // Initialize time
-                        return date >= testPeriodStart && date <= latestWorkedDay; // Count only work between test period start and latestWorkedDay
-                    }).length;
-                }
-                // If latestWorkedDay is before testPeriodStart, effectiveWorkedDaysForCond1Test will be 0 (correct behavior)
-
-                if (effectiveWorkedDaysForCond1Test < testTotalDays / 3) {
-                    nextPossible1Date = testApplicationDate; // Found the earliest date that satisfies the condition
-                    break;
-                }
-
-                testApplicationDate.setDate(testApplicationDate.getDate() + 1); // Move to the next day
-                loopCount++;
-            }
-
-            if (nextPossible1Date) {
-                nextPossible1Message = `📅 조건 1 충족을 위한 가장 빠른 신청 가능일: **${formatDateToYYYYMMDD(nextPossible1Date)}** (이후 근로제공이 없다는 전제)`;
-            } else {
-                nextPossible1Message = `🤔 조건 1 충족을 위한 빠른 신청 가능일을 찾을 수 없습니다. (선택된 근무일이 매우 많거나 계산 범위(${maxLoopDays}일) 초과)`;
-            }
-        }
-
-
-        // --- Condition 2 Current Judgment (based on base date) ---
-        const fourteenDaysRangeForCurrentInput = [];
-        const fourteenDaysStartForCurrentInput = new Date(FOURTEEN_DAYS_START_STR);
-        fourteenDaysStartForCurrentInput.setHours(0,0,0,0); // Initialize time
-        const fourteenDaysEndForCurrentInput = new Date(FOURTEEN_DAYS_END_STR);
-        fourteenDaysEndForCurrentInput.setHours(0,0,0,0); // Initialize time
-
-        let tempDateForRange = new Date(fourteenDaysStartForCurrentInput);
-        while (tempDateForRange <= fourteenDaysEndForCurrentInput) {
-            fourteenDaysRangeForCurrentInput.push(formatDateToYYYYMMDD(tempDateForRange));
-            tempDateForRange.setDate(tempDateForRange.getDate() + 1);
-        }
-
-        const noWork14Days = fourteenDaysRangeForCurrentInput.every(dateStr => !selectedFullDates.includes(dateStr)); // Check for 14 days of no work
-        
-        let condition2Text = noWork14Days
-            ? `✅ 조건 2 충족: 신청일 직전 14일간(${FOURTEEN_DAYS_START_STR} ~ ${FOURTEEN_DAYS_END_STR}) 무근무`
-            : `❌ 조건 2 불충족: 신청일 직전 14일간(${FOURTEEN_DAYS_START_STR} ~ ${FOURTEEN_DAYS_END_STR}) 내 근무기록 존재`;
-
-        let nextPossible2Message = "";
-        let nextPossible2Date = null; // Store as Date object
-
-        if (!noWork14Days) { // If Condition 2 is not met for the current base date, calculate the earliest possible date
-            if (latestWorkedDay) { // If there is a latest worked day
-                nextPossible2Date = new Date(latestWorkedDay);
-                nextPossible2Date.setDate(nextPossible2Date.getDate() + 14 + 1); // Last worked day + 14 days no work + 1 day (possible application date)
-                nextPossible2Date.setHours(0,0,0,0); // Initialize time
-                nextPossible2Message = `📅 조건 2 충족을 위한 가장 빠른 신청 가능일: **${formatDateToYYYYMMDD(nextPossible2Date)}** (마지막 근로일(${formatDateToYYYYMMDD(latestWorkedDay)}) 기준) (이후 근로제공이 없다는 전제)`;
-            } else {
-                nextPossible2Message = `🤔 조건 2 충족을 위한 빠른 신청 가능일을 찾을 수 없습니다. (근무 기록 확인 필요)`;
-            }
-        }
-
-        // --- Final Application Eligibility Judgment (based on current base date) ---
-        const generalWorkerEligible = condition1Met;
-        // const constructionWorkerEligible = condition1Met || noWork14Days; // Construction daily workers only need to meet one of the two conditions
-        const constructionWorkerEligible = noWork14Days;
-        
-        const generalWorkerText = generalWorkerEligible ? "✅ 신청 가능" : "❌ 신청 불가능";
-        const constructionWorkerText = constructionWorkerEligible ? "✅ 신청 가능" : "❌ 신청 불가능";
-        
-        // Construct and display final HTML
-        const finalHtml = `
-            <h3>📌 기준 날짜(${INPUT_DATE_STR}) 기준 조건 판단</h3>
-            <p>조건 1: 신청일이 속한 달의 직전 달 첫날부터 신청일까지 근무일 수가 전체 기간의 1/3 미만</p>
-            <p>조건 2: 건설일용근로자만 해당, 신청일 직전 14일간(신청일 제외) 근무 사실 없어야 함</p>
-            <p>총 기간 일수: ` + currentTotalDaysForCond1 + `일</p>
-            <p>1/3 기준: ` + currentThresholdForCond1.toFixed(1) + `일</p>
-            <p>근무일 수: ` + actualWorkedDaysForCond1 + `일</p>
-            <p>` + condition1Text + `</p>
-            <p>` + condition2Text + `</p>
-            ` + (nextPossible1Message ? "<p>" + nextPossible1Message + "</p>" : "") + `
-            ` + (nextPossible2Message ? "<p>" + nextPossible2Message + "</p>" : "") + `
-            <h3>📌 기준 날짜(${INPUT_DATE_STR}) 기준 최종 판단</h3>
-            <p>✅ 일반일용근로자: ` + generalWorkerText + `</p>
-            <p>✅ 건설일용근로자: ` + constructionWorkerText + `</p>
-            <p>※ 위의 '신청 가능일'은 이후 근로제공이 전혀 없다는 전제 하에 계산된 것이며, 실제 고용센터 판단과는 다를 수 있습니다.</p>
-        `;
-
-        document.getElementById('resultContainer').innerHTML = finalHtml;
-    }
-
-    // Toggle date selection/deselection function
-    function toggleDate(element) {
-        element.classList.toggle('selected');
-        const selected = [];
-        const days = document.getElementsByClassName('day');
-        for (let i = 0; i < days.length; i++) {
-            if (days[i].classList.contains('selected')) {
-                selected.push(days[i].getAttribute('data-date'));
-            }
-        }
-        saveToLocalStorage(selected); // Save to local storage
-        calculateAndDisplayResult(selected); // Recalculate result
-    }
-
-    // Load selected dates from local storage
-    function loadSelectedDates() {
-        try {
-            const storedDates = JSON.parse(localStorage.getItem('selectedDates')) || [];
-            storedDates.forEach(mmdd => {
-                // Add 'selected' class only to dates present in the current calendar
-                const dayElement = document.querySelector(`.day[data-date="${mmdd}"]`);
-                if (dayElement) {
-                    dayElement.classList.add('selected');
-                }
-            });
-            calculateAndDisplayResult(storedDates); // Calculate initial result with loaded dates
-        } catch (e) {
-            console.error("Failed to load selected dates from localStorage or calculate result:", e);
-            calculateAndDisplayResult([]); // Initialize with empty state on error
-        }
-    }
-
-    // Save selected dates to local storage
-    function saveToLocalStorage(data) {
-        try {
-            localStorage.setItem('selectedDates', JSON.stringify(data));
-        } catch (e) {
-            console.error("Failed to save selected dates to localStorage:", e);
-        }
-    }
-
-    // Function to clear all selected dates
-    window.clearCalendar = function() { // Make it global by assigning to window
-        // Remove 'selected' class from all days
-        const days = document.getElementsByClassName('day');
-        for (let i = 0; i < days.length; i++) {
-            days[i].classList.remove('selected');
-        }
-        // Clear local storage
-        saveToLocalStorage([]);
-        // Recalculate and display result
-        calculateAndDisplayResult([]);
-    };
-
-
-    // DOMContentLoaded event listener: Execute script after HTML document is fully loaded and parsed
-    document.addEventListener('DOMContentLoaded', function() {
-        loadSelectedDates();
-    });
-    </script>
+def import_worked_dates(start_date, end_date):
     """
+    근무일 불러오기 (CSV/텍스트 파일 업로드 또는 붙여넣기)
+    - 반환값: 불러오기를 누른 실행에서만 기간 안의 근무일(YYYY-MM-DD) 튜플, 그 외에는 None
+    """
+    with st.expander("📂 근무일 불러오기 (근로내역 CSV 또는 날짜 목록)"):
+        with st.form("daily_import_form", clear_on_submit=True):
+            uploaded = st.file_uploader("CSV/텍스트 파일", type=["csv", "txt"])
+            pasted = st.text_area("또는 날짜 붙여넣기", placeholder="2025-03-03\n2025.03.04\n20250305")
+            submitted = st.form_submit_button("불러오기")
+    if not submitted:
+        return None
+
+    text = pasted or ""
+    if uploaded is not None:
+        text += "\n" + decode_text(uploaded.getvalue())
+    dates, invalid = parse_worked_dates(text)
+    inside, outside = split_by_window(dates, start_date, end_date)
+    # 제외한 항목은 반영할 날짜가 하나도 없어도 먼저 알려 줌
+    if invalid:
+        st.warning(f"존재하지 않는 날짜 {len(invalid)}개는 제외했습니다: {', '.join(invalid[:5])}")
+    if outside:
+        st.warning(f"달력 기간({start_date} ~ {end_date}) 밖의 날짜 {len(outside)}개는 제외했습니다.")
+    if not dates and not invalid:
+        st.warning("날짜를 찾지 못했습니다. YYYY-MM-DD 형식 등으로 입력해 주세요.")
+    if not inside:
+        return None
+    st.success(f"근무일 {len(inside)}일을 달력에 반영했습니다.")
+    return tuple(d.isoformat() for d in inside)
+
+
+# 날짜/달력을 바꿀 때마다 이 화면만 다시 실행 (main.py의 스타일/메뉴/안내문은 건너뜀)
+@st.fragment
+def daily_worker_eligibility_app():
+    if "daily_base_date" not in st.session_state:
+        st.session_state.daily_base_date = today_kst()
+        st.session_state.daily_initial_dates = None
+        # 공유 링크(?cal=YYYYMMDD.<비트마스크>)로 들어오면 기준 날짜와 근무일을 그대로 복원
+        token = st.query_params.get("cal")
+        if token:
+            try:
+                st.session_state.daily_base_date, st.session_state.daily_initial_dates = decode_calendar_token(token)
+            except ValueError:
+                del st.query_params["cal"]
+    input_date = st.date_input("📅 기준 날짜 선택", key="daily_base_date")
+    lookback_months = st.selectbox(
+        "🗓️ 달력 표시 기간",
+        LOOKBACK_OPTIONS,
+        format_func=lambda n: f"최근 {n}개월" + (" (판단 기간)" if n == 2 else ""),
+        key="daily_lookback_months",
+    )
+
+    # Period used for the conditions (from the first day of the previous month to the selected date)
+    first_day_prev_month = first_day_of_prev_month(input_date)
+    # Period shown in the calendar (older months are for what-if editing and collapsed at first)
+    calendar_start = first_day_of_months_before(input_date, lookback_months - 1)
 
-    st.components.v1.html(calendar_html, height=1500, scrolling=False)
-
-
+    input_date_str = input_date.strftime("%Y-%m-%d")
+    window_start_str = first_day_prev_month.strftime("%Y-%m-%d")
+
+    def in_window(dates):
+        # 판단 기간 밖의 날짜는 결과에 영향이 없으므로 캐시 키에서 제외
+        return tuple(d for d in dates if d >= window_start_str)
+
+    imported = import_worked_dates(calendar_start, input_date)
+    if imported is not None:
+        # 같은 목록을 다시 불러와도 달력에 다시 적용되도록 번호를 올림
+        st.session_state.daily_initial_dates = imported
+        st.session_state.daily_initial_revision = st.session_state.get("daily_initial_revision", 0) + 1
+
+    costs = None
+    if st.checkbox("➕ 하루 더 근무하면 신청 가능일이 며칠 늦어지는지 달력에 표시 (일반/건설)", key="daily_show_delay"):
+        # 이번 실행을 일으킨 달력 값으로 미리 계산해 같은 호출에서 함께 보냄
+        current = imported if imported is not None else calendar_selection(
+            st.session_state.get("daily_calendar"),
+            calendar_start,
+            input_date,
+            st.session_state.daily_initial_dates,
+        )
+        costs = calculate_delay_costs(input_date_str, in_window(current))
+
+    # The browser builds the grid from a compact layout; selected days come back here
+    selected_dates = daily_calendar(
+        calendar_start,
+        input_date,
+        initial_dates=st.session_state.daily_initial_dates,
+        initial_revision=st.session_state.get("daily_initial_revision", 0),
+        delay_costs=costs,
+        expanded_months=2,
+        key="daily_calendar",
+    )
+    if imported is not None:
+        # 브라우저가 불러온 목록을 적용해 다시 보내기 전에도 바로 결과를 보여줌
+        selected_dates = imported
+    selected_dates = in_window(selected_dates)
+    if selected_dates:
+        # 기준 날짜를 바꿔 가며 다시 계산하지 않도록 이후 날짜 전체를 한 번에 보여줌
+        timeline_html = render_timeline_html(calculate_timeline(input_date_str, selected_dates))
+        st.markdown(f'<div id="timelineContainer">{timeline_html}</div>', unsafe_allow_html=True)
+
+    result = calculate_result(input_date_str, selected_dates)
+    result_html = render_result_html(result)
+    st.markdown(f'<div id="resultContainer">{result_html}</div>', unsafe_allow_html=True)
+
+    # 현재 상태를 URL에 기록 - 이 주소를 그대로 공유하면 같은 결과가 열립니다
+    token = encode_calendar_token(input_date, selected_dates)
+    if st.query_params.get("cal") != token:
+        st.query_params["cal"] = token
@@ -0,0 +1,60 @@
+"""
+날짜 계산 공통 모듈 (pandas/pytz 없이 표준 라이브러리만 사용)
+
+일용직 화면과 판단 엔진이 같이 씁니다.
+날짜 구간은 서수(date.toordinal) 산술로 만들고, 한국 시간은 zoneinfo로 구합니다.
+"""
+from datetime import date, datetime, timedelta, timezone
+
+try:
+    from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+    KST = ZoneInfo("Asia/Seoul")
+except (ImportError, ZoneInfoNotFoundError):
+    # tz 데이터베이스가 없는 환경: 한국은 서머타임이 없으므로 고정 오프셋과 같음
+    KST = timezone(timedelta(hours=9), "KST")
+
+
+def now_kst():
+    """현재 한국 시각 (tz-aware datetime)"""
+    return datetime.now(KST)
+
+
+def today_kst():
+    """오늘 날짜 (한국 기준)"""
+    return now_kst().date()
+
+
+def to_date(value):
+    """date 또는 YYYY-MM-DD 문자열을 date로 변환"""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(value)
+
+
+def first_day_of_prev_month(d):
+    """d가 속한 달의 직전 달 1일"""
+    return (d.replace(day=1) - timedelta(days=1)).replace(day=1)
+
+
+def first_day_of_months_before(d, months):
+    """d가 속한 달에서 months개월 전 달의 1일 (months=1이면 first_day_of_prev_month와 같음)"""
+    index = d.year * 12 + d.month - 1 - months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def last_day_of_month(d):
+    """d가 속한 달의 마지막 날"""
+    return (d.replace(day=28) + timedelta(days=4)).replace(day=1) - timedelta(days=1)
+
+
+def days_between(start, end):
+    """start~end(양 끝 포함) 일수, end가 앞서면 0"""
+    return max(end.toordinal() - start.toordinal() + 1, 0)
+
+
+def date_range(start, end):
+    """start~end(양 끝 포함) 날짜 목록"""
+    return [date.fromordinal(o) for o in range(start.toordinal(), end.toordinal() + 1)]
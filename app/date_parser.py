@@ -0,0 +1,49 @@
+"""
+근무 내역 텍스트/CSV에서 날짜 추출 (streamlit 비의존)
+
+근로내역 내보내기 파일이나 붙여넣은 목록 전체를 정규식 한 번으로 훑어
+YYYY-MM-DD, YYYY.MM.DD, YYYY/MM/DD, YYYYMMDD, YYYY년 M월 D일 형식의 날짜를 모읍니다.
+"""
+import re
+from datetime import date
+
+_DATE_PATTERN = re.compile(
+    r"(?<!\d)((?:19|20)\d{2})\s*[-./년]\s*(\d{1,2})\s*[-./월]\s*(\d{1,2})(?!\d)"
+    r"|(?<!\d)((?:19|20)\d{2})(\d{2})(\d{2})(?!\d)"
+)
+
+# 내보내기 파일에서 자주 쓰이는 인코딩 (한글 Windows는 cp949)
+_ENCODINGS = ("utf-8-sig", "cp949")
+
+
+def decode_text(data):
+    """업로드된 bytes -> str (utf-8, 실패하면 cp949)"""
+    for encoding in _ENCODINGS:
+        try:
+            return data.decode(encoding)
+        except UnicodeDecodeError:
+            continue
+    return data.decode("utf-8", errors="replace")
+
+
+def parse_worked_dates(text):
+    """
+    텍스트 안의 날짜 -> (날짜 튜플(중복 제거, 오름차순), 날짜로 읽을 수 없는 항목 튜플)
+    예: 2025-02-30처럼 형식은 맞지만 없는 날짜는 두 번째 값으로 돌려줍니다.
+    """
+    dates = set()
+    invalid = []
+    for match in _DATE_PATTERN.finditer(text):
+        year, month, day = (int(g) for g in match.groups() if g is not None)
+        try:
+            dates.add(date(year, month, day))
+        except ValueError:
+            invalid.append(match.group(0))
+    return tuple(sorted(dates)), tuple(invalid)
+
+
+def split_by_window(dates, start, end):
+    """날짜 -> (start~end 안의 날짜, 밖의 날짜)"""
+    inside = tuple(d for d in dates if start <= d <= end)
+    outside = tuple(d for d in dates if not start <= d <= end)
+    return inside, outside
@@ -1,73 +1,47 @@
 import streamlit as st
-from app.questions import get_employment_questions, get_self_employment_questions
+from app.fragments import rerun_fragment
+from app.questionnaire import QUESTIONNAIRES
+from app.questionnaire_ui import one_page_mode, questionnaire_form, questionnaire_steps, reset_answers, save_answers, show_outcome
 
+# 취업 형태 -> 질문지 (app/questions.py의 QUESTIONNAIRES)
+EMPLOYMENT_TYPES = {
+    "일반 회사 취업": "early_employment",
+    "자영업/특수고용직/예술인": "early_self_employment",
+}
+
+# 답을 고를 때마다 이 질문 화면만 다시 실행 (main.py의 스타일/메뉴/안내문은 건너뜀)
+@st.fragment
 def early_reemployment_app():
-    if "early_step" not in st.session_state:
-        st.session_state.early_step = 0
-        st.session_state.early_answers = []
-        st.session_state.employment_type = None
-        st.session_state.early_questions = []
+    # 한 화면 모드: 취업 형태를 고른 뒤 나머지 답을 한 번에 제출해 한 번의 실행으로 판단
+    if one_page_mode("early_one_page"):
+        employment_type = st.radio("새 일자리의 취업 형태를 선택하세요", list(EMPLOYMENT_TYPES), horizontal=True, key="early_form_type")
+        name = EMPLOYMENT_TYPES[employment_type]
+        outcome = questionnaire_form(f"{name}_form", QUESTIONNAIRES[name])
+        if outcome is not None:
+            show_outcome(outcome)
+        return
+
+    # 진행 상황: ?early=<취업 형태 0/1><답변 1/0...> (예: 0110 = 일반 회사 취업, 예/예/아니요)
+    token = st.query_params.get("early", "")
+    types = list(EMPLOYMENT_TYPES)
 
     # 1단계: 취업 형태 선택
-    if st.session_state.early_step == 0:
+    if token[:1] not in ("0", "1"):
         q = "새 일자리가 일반 회사 취업인가요,\n자영업/특수고용직(예: 예술인, 노무제공자)인가요?"
         st.write(f"**{q}**")
         ans = st.radio(
             "선택하세요",
-            ["일반 회사 취업", "자영업/특수고용직/예술인"],
+            types,
             key="early_q0"
         )
         if st.button("➡️ 다음"):
-            st.session_state.employment_type = ans
-            st.session_state.early_answers.append(ans)
-            st.session_state.early_questions = (
-                get_employment_questions() if ans == "일반 회사 취업"
-                else get_self_employment_questions()
-            )
-            st.session_state.early_step += 1
-            st.rerun()
-
-    # 2단계 이후 질문
-    elif st.session_state.early_step <= len(st.session_state.early_questions):
-        idx = st.session_state.early_step - 1
-        q = st.session_state.early_questions[idx]
-        st.write(f"**Q{st.session_state.early_step}. {q}**")
-        ans = st.radio(
-            "선택하세요",
-            ["예", "아니요"],
-            key=f"early_q{st.session_state.early_step}"
-        )
-        if st.button("➡️ 다음", key=f"early_next_{st.session_state.early_step}"):
-            st.session_state.early_answers.append(ans)
-            st.session_state.early_step += 1
-            st.rerun()
+            save_answers("early", str(types.index(ans)))
+            rerun_fragment()
 
-    # 모든 질문 완료 → 바로 결과 표시
+    # 2단계 이후 질문 (조건에 어긋나는 답이 나오면 남은 질문 없이 바로 결과)
     else:
-        answers = st.session_state.early_answers[1:]  # 첫번째는 employment type
-        if st.session_state.employment_type == "일반 회사 취업":
-            required = ["예", "예", "예", "예", "아니요", "아니요", "아니요", "아니요", "아니요", "아니요"]
-            questions = get_employment_questions()
-        else:
-            required = ["예", "예", "예", "아니요", "아니요"]  # 자영업 준비활동 질문 삭제 후 수정
-            questions = get_self_employment_questions()
-
-        mismatches = [
-            (i+1, q, a, r)
-            for i, (q, a, r) in enumerate(zip(questions, answers, required))
-            if a != r
-        ]
-
-        if not mismatches:
-            st.success("✅ 모든 조건을 충족했습니다.\n고용센터에 문의하여 청구를 진행하세요.")
-        else:
-            st.warning("❌ 아래 조건이 충족되지 않았습니다:")
-            for i, q, a, r in mismatches:
-                st.write(f"- Q{i}: {q} (답변: {a} / 필요: {r})")
-            st.info("위 조건에 대해 고용센터에 추가 문의가 필요할 수 있습니다.")
+        questionnaire_steps("early", QUESTIONNAIRES[EMPLOYMENT_TYPES[types[int(token[0])]]], prefix=token[0])
 
     if st.button("🔄 처음부터 다시 시작"):
-        for key in ["early_step", "early_answers", "employment_type", "early_questions"]:
-            if key in st.session_state:
-                del st.session_state[key]
-        st.rerun()
+        reset_answers("early")
+        rerun_fragment()
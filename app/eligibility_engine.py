@@ -0,0 +1,299 @@
+"""
+일용근로자 수급자격 판단 엔진 (streamlit 없이 import 가능)
+
+근무일을 날짜 서수(ordinal) 기준 비트맵과 누적합 배열로 보관하여
+"X~Y 사이 근무일 수", "D 직전 14일간 근무 여부"를 O(1)로 계산합니다.
+화면(app/daily_worker_eligibility.py)과 일괄 처리 모두 이 모듈을 사용합니다.
+"""
+from dataclasses import dataclass
+from datetime import date, timedelta
+from itertools import accumulate
+
+from app.date_kernel import days_between, first_day_of_prev_month, last_day_of_month, to_date, today_kst
+
+# 조건 2: 신청일 직전 14일간(신청일 제외) 무근무
+NO_WORK_DAYS = 14
+
+
+class WorkHistory:
+    """
+    근무일 비트맵 + 누적합
+
+    - origin: 비트맵 0번 칸의 날짜
+    - bitmap: 하루 1칸, 근무일이면 1
+    - prefix: prefix[i] = bitmap[:i]의 근무일 수
+    비트맵 범위 밖의 날짜는 근무하지 않은 것으로 봅니다(이후 근로제공 없음 전제).
+    """
+
+    __slots__ = ("origin", "bitmap", "prefix", "last_worked")
+
+    def __init__(self, origin, bitmap):
+        self.origin = origin
+        self.bitmap = bytes(bitmap)
+        self.prefix = list(accumulate(self.bitmap, initial=0))
+        last = self.bitmap.rfind(1)
+        self.last_worked = origin + timedelta(days=last) if last >= 0 else None
+
+    @classmethod
+    def from_dates(cls, worked_dates, origin=None, end=None):
+        """
+        - worked_dates: date 또는 YYYY-MM-DD 문자열의 iterable
+        - origin/end: 비트맵 범위 (생략 시 근무일의 최소/최대)
+        """
+        ordinals = {to_date(d).toordinal() for d in worked_dates}
+        if origin is not None:
+            start = to_date(origin).toordinal()
+        else:
+            start = min(ordinals, default=today_kst().toordinal())
+        if end is not None:
+            stop = to_date(end).toordinal()
+        else:
+            stop = max(ordinals, default=start)
+        bitmap = bytearray(max(stop - start + 1, 0))
+        for o in ordinals:
+            if start <= o <= stop:
+                bitmap[o - start] = 1
+        return cls(date.fromordinal(start), bitmap)
+
+    def __len__(self):
+        return self.prefix[-1]
+
+    def __contains__(self, day):
+        i = to_date(day).toordinal() - self.origin.toordinal()
+        return 0 <= i < len(self.bitmap) and self.bitmap[i] == 1
+
+    def worked_dates(self):
+        """근무일 목록 (오름차순)"""
+        return [self.origin + timedelta(days=i) for i, bit in enumerate(self.bitmap) if bit]
+
+    def count(self, start, end):
+        """start~end(양 끝 포함) 근무일 수 - O(1)"""
+        o = self.origin.toordinal()
+        i = max(to_date(start).toordinal() - o, 0)
+        j = min(to_date(end).toordinal() - o + 1, len(self.bitmap))
+        if j <= i:
+            return 0
+        return self.prefix[j] - self.prefix[i]
+
+    def worked_within(self, day, days=NO_WORK_DAYS):
+        """day 직전 days일간(day 제외) 근무 여부 - O(1)"""
+        day = to_date(day)
+        return self.count(day - timedelta(days=days), day - timedelta(days=1)) > 0
+
+    def condition1(self, apply_date):
+        """
+        조건 1 집계: (근무일 수, 총 기간 일수)
+        기간은 신청일이 속한 달의 직전 달 1일부터 신청일까지입니다.
+        """
+        apply_date = to_date(apply_date)
+        start = first_day_of_prev_month(apply_date)
+        return self.count(start, apply_date), days_between(start, apply_date)
+
+    def condition1_met(self, apply_date):
+        """조건 1: 근무일 수 < 총 일수의 1/3 (신청일 당일 근무 시 불충족)"""
+        if apply_date in self:
+            return False
+        worked, total = self.condition1(apply_date)
+        return worked * 3 < total
+
+    def condition2_met(self, apply_date):
+        """조건 2: 신청일 직전 14일간 무근무 (신청일 당일 근무 시 불충족)"""
+        if apply_date in self:
+            return False
+        return not self.worked_within(apply_date)
+
+
+# 가장 빠른 신청 가능일 탐색 범위 (기존 화면의 365일 탐색과 동일)
+SEARCH_DAYS = 365
+
+
+def _first_condition1_in_month(history, t, hi):
+    """
+    t~hi(같은 달) 중 조건 1을 충족하는 첫 날 (없으면 None)
+    근무하지 않은 날이 이어지는 동안은 근무일 수가 고정이므로 그 구간마다
+    근무일 수 * 3 < (날짜 - 기간 시작일 + 1) 을 만족하는 첫 날을 바로 계산하고,
+    비트맵에서 다음 근무일을 찾아 그 뒤 구간으로 건너뜁니다 - O(구간 안 근무일 수)
+    """
+    period_start = first_day_of_prev_month(t)
+    o = history.origin.toordinal()
+    day, end = t.toordinal(), hi.toordinal()
+    while day <= end:
+        nxt = history.bitmap.find(1, max(day - o, 0), max(end - o + 1, 0))
+        gap_end = end if nxt < 0 else nxt + o - 1
+        if day <= gap_end:
+            worked = history.count(period_start, date.fromordinal(day))
+            candidate = max(day, period_start.toordinal() + worked * 3)
+            if candidate <= gap_end:
+                return date.fromordinal(candidate)
+        day = gap_end + 2  # 근무일(gap_end + 1)은 조건 1 불충족
+    return None
+
+
+def _earliest_condition1(history, start, stop):
+    t = start
+    while t <= stop:
+        hi = min(last_day_of_month(t), stop)
+        found = _first_condition1_in_month(history, t, hi)
+        if found is not None:
+            return found
+        t = hi + timedelta(days=1)
+    return None
+
+
+def _earliest_condition2(history, start, stop):
+    t = start
+    last = history.last_worked
+    if last is not None:
+        # 마지막 근무일 이전 구간은 하루씩 O(1) 판정
+        while t <= min(last, stop):
+            if history.condition2_met(t):
+                return t
+            t += timedelta(days=1)
+        # 마지막 근무일 + 14일 무근무 + 1일
+        t = max(t, last + timedelta(days=NO_WORK_DAYS + 1))
+    return t if t <= stop else None
+
+
+def earliest_condition1_date(history, start, limit=SEARCH_DAYS):
+    """
+    start(포함)부터 limit일 안에서 조건 1을 충족하는 가장 빠른 날짜 (없으면 None)
+    이후 근로제공이 없다는 전제로 달마다, 그 달 안에서는 근무일 사이 구간마다 한 번씩만 계산합니다
+    - O(개월 수 + 탐색 범위 안 근무일 수)
+    """
+    start = to_date(start)
+    return _earliest_condition1(history, start, start + timedelta(days=limit - 1))
+
+
+def earliest_condition2_date(history, start, limit=SEARCH_DAYS):
+    """start(포함)부터 limit일 안에서 조건 2를 충족하는 가장 빠른 날짜 (없으면 None)"""
+    start = to_date(start)
+    return _earliest_condition2(history, start, start + timedelta(days=limit - 1))
+
+
+def earliest_both_conditions_date(history, start, limit=SEARCH_DAYS):
+    """start(포함)부터 limit일 안에서 조건 1과 조건 2를 모두 충족하는 가장 빠른 날짜"""
+    start = to_date(start)
+    stop = start + timedelta(days=limit - 1)
+    t = start
+    while t is not None:
+        t = _earliest_condition2(history, t, stop)
+        if t is None:
+            return None
+        t = _earliest_condition1(history, t, stop)
+        if t is None or history.condition2_met(t):
+            return t
+    return None
+
+
+# 신청 가능 여부 타임라인 기본 일수
+TIMELINE_DAYS = 60
+
+
+def eligibility_timeline(history, start, days=TIMELINE_DAYS):
+    """
+    start(포함)부터 days일 동안 날마다 그날 신청할 때의 (날짜, 조건 1, 조건 2) 튜플
+    누적합으로 날짜마다 O(1)이므로 한 번에 전체 구간을 계산합니다 (이후 근로제공 없음 전제).
+    """
+    start = to_date(start)
+    return tuple(
+        (day, history.condition1_met(day), history.condition2_met(day))
+        for day in (start + timedelta(days=i) for i in range(days))
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class EligibilityResult:
+    """
+    기준 날짜 하루에 대한 조건 판단 결과 (HTML 없음, 해시/비교/직렬화 가능)
+
+    - earliest_condition1/2: 조건을 이미 충족하면 기준 날짜, 아니면 다음 날부터 탐색한 가장 빠른 날짜 (없으면 None)
+    - base_worked: 기준 날짜 당일 근무 여부 (이 경우 두 조건 모두 불충족)
+    """
+
+    base_date: date
+    worked_days: int
+    total_days: int
+    condition1: bool
+    condition2: bool
+    earliest_condition1: date | None
+    earliest_condition2: date | None
+    last_worked: date | None
+    base_worked: bool
+
+    @property
+    def threshold(self):
+        """조건 1 기준 일수 (총 일수의 1/3)"""
+        return self.total_days / 3
+
+    @property
+    def general_eligible(self):
+        """일반일용근로자: 조건 1"""
+        return self.condition1
+
+    @property
+    def construction_eligible(self):
+        """건설일용근로자: 조건 2"""
+        return self.condition2
+
+
+def evaluate(selected_dates, base_date):
+    """
+    기준 날짜에 신청한다고 할 때의 조건 판단 결과 (일용직 달력 화면과 같은 규칙)
+
+    - selected_dates: date 또는 YYYY-MM-DD 근무일 iterable (기준 날짜 이후 근무는 없다고 전제)
+    - 반환값: EligibilityResult
+    """
+    base_date = to_date(base_date)
+    history = WorkHistory.from_dates(selected_dates, origin=first_day_of_prev_month(base_date), end=base_date)
+    worked_days, total_days = history.condition1(base_date)
+    condition1 = history.condition1_met(base_date)
+    condition2 = history.condition2_met(base_date)
+    next_day = base_date + timedelta(days=1)
+    return EligibilityResult(
+        base_date=base_date,
+        worked_days=worked_days,
+        total_days=total_days,
+        condition1=condition1,
+        condition2=condition2,
+        earliest_condition1=base_date if condition1 else earliest_condition1_date(history, next_day),
+        earliest_condition2=base_date if condition2 else earliest_condition2_date(history, next_day),
+        last_worked=history.last_worked,
+        base_worked=base_date in history,
+    )
+
+
+def delay_costs(selected_dates, base_date):
+    """
+    판단 기간 안의 근무하지 않은 날 X마다, X에 하루 더 근무하면
+    가장 빠른 신청 가능일(일반: 조건 1, 건설: 조건 2)이 며칠 늦어지는지 -> {X: (일반, 건설)}
+    (늦어지는 날짜를 구할 수 없으면 None)
+
+    기준 날짜 이후 근무가 없으면 조건 1 결과는 X가 속한 달과 X가 기준 날짜인지에만 좌우되므로
+    그 묶음마다 한 번씩만 계산하고, 조건 2는 max(마지막 근무일, X) + 15일로 바로 구합니다.
+    """
+    base_date = to_date(base_date)
+    start = first_day_of_prev_month(base_date)
+    worked = {to_date(d) for d in selected_dates}
+    current = evaluate(worked, base_date)
+    last = current.last_worked
+    no_work_from = base_date - timedelta(days=NO_WORK_DAYS)
+
+    def delay(before, after):
+        return (after - before).days if before is not None and after is not None else None
+
+    general_by_group = {}
+    costs = {}
+    for day in (start + timedelta(days=i) for i in range(days_between(start, base_date))):
+        if day in worked:
+            continue
+        group = (day.year, day.month, day == base_date)
+        if group not in general_by_group:
+            shifted = evaluate(worked | {day}, base_date)
+            general_by_group[group] = delay(current.earliest_condition1, shifted.earliest_condition1)
+        if current.condition2 and day < no_work_from:
+            construction = 0
+        else:
+            new_last = day if last is None or day > last else last
+            construction = delay(current.earliest_condition2, new_last + timedelta(days=NO_WORK_DAYS + 1))
+        costs[day] = (general_by_group[group], construction)
+    return costs
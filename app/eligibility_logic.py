@@ -1,10 +1,21 @@
+from datetime import datetime, timedelta
+
+from app.eligibility_engine import WorkHistory, evaluate
+
+
 def check_conditions(selected_dates, cal_dates, fourteen_start, fourteen_end):
     """
     - selected_dates: YYYY-MM-DD 형식 근무일 리스트
-    - cal_dates: YYYY-MM-DD 형식 달력 전체 날짜 리스트
+    - cal_dates: YYYY-MM-DD 형식 달력 전체 날짜 리스트 (연속된 기간, 오름차순)
     - fourteen_start: YYYY-MM-DD 형식 14일간 시작일
     - fourteen_end: YYYY-MM-DD 형식 14일간 종료일
+
+    기존 화면(daily_worker_eligibility1.py)과 같은 규칙으로 판단합니다:
+    근무일 수는 selected_dates 전체, 건설일용근로자는 조건 1 또는 조건 2 충족 시 신청 가능.
+    (check_conditions_many / evaluate()는 판단 기간 안의 근무일만 세고 건설일용근로자는 조건 2만 봄)
+    cal_dates가 연속된 날짜가 아니거나 14일간 시작일이 종료일보다 늦으면 ValueError
     """
+    _validate_period(cal_dates, fourteen_start, fourteen_end)
 
     total_days = len(cal_dates)
     threshold = total_days / 3
@@ -13,14 +24,16 @@ def check_conditions(selected_dates, cal_dates, fourteen_start, fourteen_end):
     # 조건 1: 근무일 수가 총 일수 1/3 미만인가?
     cond1 = worked_days < threshold
 
-    # 조건 2: 신청일 직전 14일간 근무 여부 (없어야 충족)
-    fourteen_range = [d for d in cal_dates if fourteen_start <= d <= fourteen_end]
-    cond2 = all(day not in selected_dates for day in fourteen_range)
+    # 조건 2: 신청일 직전 14일간 근무 여부 (없어야 충족) - 달력 기간 안의 근무일만 O(1)로 집계
+    if cal_dates:
+        history = WorkHistory.from_dates(selected_dates, origin=cal_dates[0], end=cal_dates[-1])
+        cond2 = history.count(fourteen_start, fourteen_end) == 0
+    else:
+        cond2 = True
 
     # 조건 2 충족 여부 및 다음 신청 가능 날짜 안내
     if not cond2:
         # 조건 2를 충족하려면 14일간 무근무 기간 종료 후 신청 가능
-        from datetime import datetime, timedelta
         next_possible_date = datetime.strptime(fourteen_end, "%Y-%m-%d") + timedelta(days=14)
         next_possible_str = next_possible_date.strftime("%Y-%m-%d")
         next_msg = f"📅 조건 2를 충족하려면 {next_possible_str} 이후에 신청하면 조건 2를 충족할 수 있습니다."
@@ -42,3 +55,26 @@ def check_conditions(selected_dates, cal_dates, fourteen_start, fourteen_end):
     """
 
     return result_html
+
+
+def _validate_period(cal_dates, fourteen_start, fourteen_end):
+    """check_conditions 입력 확인 (O(1): 첫날/마지막 날과 길이만 비교)"""
+    start = datetime.strptime(fourteen_start, "%Y-%m-%d")
+    end = datetime.strptime(fourteen_end, "%Y-%m-%d")
+    if end < start:
+        raise ValueError(f"14일간 시작일({fourteen_start})이 종료일({fourteen_end})보다 늦습니다")
+    if cal_dates:
+        first = datetime.strptime(cal_dates[0], "%Y-%m-%d")
+        last = datetime.strptime(cal_dates[-1], "%Y-%m-%d")
+        if (last - first).days + 1 != len(cal_dates):
+            raise ValueError(f"cal_dates는 {cal_dates[0]}부터 하루씩 이어지는 날짜여야 합니다 ({len(cal_dates)}개)")
+
+
+def check_conditions_many(scenarios):
+    """
+    여러 (근무일 목록, 기준 날짜) 조합을 한 번에 판단합니다. HTML 없이 결과만 반환합니다.
+
+    - scenarios: (selected_dates, base_date) 쌍의 iterable
+    - 반환값: 조합별 EligibilityResult 리스트 (입력 순서 유지)
+    """
+    return [evaluate(selected_dates, base_date) for selected_dates, base_date in scenarios]
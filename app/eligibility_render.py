@@ -0,0 +1,149 @@
+"""
+EligibilityResult -> 결과 HTML
+
+결과 객체는 불변/해시 가능하므로 같은 결과는 캐시된 마크업을 그대로 씁니다.
+일괄 처리처럼 화면이 필요 없는 곳은 이 모듈을 쓰지 않습니다.
+"""
+from datetime import timedelta
+from functools import lru_cache
+
+from app.eligibility_engine import NO_WORK_DAYS, SEARCH_DAYS
+from app.holiday_calendar import business_days_between, holiday_name, is_business_day, next_business_day
+
+NOTICE = "<p>※ 위의 '신청 가능일'은 이후 근로제공이 전혀 없다는 전제 하에 계산된 것이며, 실제 고용센터 판단과는 다를 수 있습니다.</p>"
+
+
+def _one_line(html):
+    # 들여쓰기/빈 줄이 마크다운 코드 블록으로 해석되지 않도록 한 줄로 합침
+    return "".join(line.strip() for line in html.splitlines())
+
+
+def _day_html(day):
+    """<b>날짜</b>, 주말·공휴일이면 고용센터 방문 가능한 다음 영업일 안내를 덧붙임"""
+    if is_business_day(day):
+        return f"<b>{day}</b>"
+    reason = holiday_name(day) or "주말"
+    return f"<b>{day}</b> ({reason}, 고용센터 방문 신청은 {next_business_day(day)}부터)"
+
+
+def _wait_html(base, day):
+    """기준 날짜 다음 날 ~ day의 영업일 수 안내"""
+    return f"(기준 날짜 다음 날부터 영업일 {business_days_between(base + timedelta(days=1), day)}일)"
+
+
+@lru_cache(maxsize=1024)
+def render_result_html(result):
+    """일용직 달력 화면의 조건 판단 결과 HTML"""
+    base = result.base_date
+
+    # --- Special Case 1: No working days selected ---
+    if result.last_worked is None:
+        return _one_line(f"""
+            <h3>📌 조건 판단</h3>
+            <p>✅ 조건 1 충족: 근무일 0일 (선택 없음)</p>
+            <p>✅ 조건 2 충족: 근무일 0일 (선택 없음)</p>
+            <h3>📌 최종 판단</h3>
+            <p>✅ 일반일용근로자: 신청 가능</p>
+            <p>✅ 건설일용근로자: 신청 가능</p>
+            <h3>📌 종합 신청 가능일</h3>
+            <p>근무일이 없으므로, 현재({base}) 바로 신청 가능합니다.</p>
+            {NOTICE}
+        """)
+
+    # --- Special Case 2: Base date is selected as a working day ---
+    # (both conditions are considered unfulfilled)
+    if result.base_worked:
+        next_possible = base + timedelta(days=NO_WORK_DAYS + 1)  # Base date + 14 days no work + 1 day
+        return _one_line(f"""
+            <h3 style="color: red;">📌 조건 판단</h3>
+            <p style="color: red;">❌ 조건 1 불충족: 기준 날짜({base}) 근무로 인한 미충족</p>
+            <p style="color: red;">❌ 조건 2 불충족: 기준 날짜({base}) 근무로 인한 미충족</p>
+            <h3 style="color: red;">📌 최종 판단</h3>
+            <p style="color: red;">❌ 일반일용근로자: 신청 불가능</p>
+            <p style="color: red;">❌ 건설일용근로자: 신청 불가능</p>
+            <h3>📌 종합 신청 가능일</h3>
+            <p style="color: red;">기준 날짜({base})에 근무 기록이 있으므로 현재 신청 불가능합니다.</p>
+            <p style="color: red;">(이 경우, {base}이 마지막 근무일이라면 {_day_html(next_possible)} 이후 신청 가능) (이후 근로제공이 없다는 전제)</p>
+            {NOTICE}
+        """)
+
+    # --- Condition 1 ---
+    condition1_text = (
+        f"✅ 조건 1 충족: 근무일 수({result.worked_days}) < 기준({result.threshold:.1f})" if result.condition1
+        else f"❌ 조건 1 불충족: 근무일 수({result.worked_days}) ≥ 기준({result.threshold:.1f})"
+    )
+    next_possible1_message = ""
+    if not result.condition1:
+        if result.earliest_condition1:
+            next_possible1_message = f"📅 조건 1 충족을 위한 가장 빠른 신청 가능일: {_day_html(result.earliest_condition1)} {_wait_html(base, result.earliest_condition1)} (이후 근로제공이 없다는 전제)"
+        else:
+            next_possible1_message = f"🤔 조건 1 충족을 위한 빠른 신청 가능일을 찾을 수 없습니다. (선택된 근무일이 매우 많거나 계산 범위({SEARCH_DAYS}일) 초과)"
+
+    # --- Condition 2 ---
+    fourteen_start = base - timedelta(days=NO_WORK_DAYS)
+    fourteen_end = base - timedelta(days=1)
+    condition2_text = (
+        f"✅ 조건 2 충족: 신청일 직전 14일간({fourteen_start} ~ {fourteen_end}) 무근무" if result.condition2
+        else f"❌ 조건 2 불충족: 신청일 직전 14일간({fourteen_start} ~ {fourteen_end}) 내 근무기록 존재"
+    )
+    next_possible2_message = ""
+    if not result.condition2:
+        next_possible2_message = f"📅 조건 2 충족을 위한 가장 빠른 신청 가능일: {_day_html(result.earliest_condition2)} {_wait_html(base, result.earliest_condition2)} (마지막 근로일({result.last_worked}) 기준) (이후 근로제공이 없다는 전제)"
+
+    # --- Final judgment (construction daily workers only need condition 2) ---
+    general_worker_text = "✅ 신청 가능" if result.general_eligible else "❌ 신청 불가능"
+    construction_worker_text = "✅ 신청 가능" if result.construction_eligible else "❌ 신청 불가능"
+
+    return _one_line(f"""
+        <h3>📌 기준 날짜({base}) 기준 조건 판단</h3>
+        <p>조건 1: 신청일이 속한 달의 직전 달 첫날부터 신청일까지 근무일 수가 전체 기간의 1/3 미만</p>
+        <p>조건 2: 건설일용근로자만 해당, 신청일 직전 14일간(신청일 제외) 근무 사실 없어야 함</p>
+        <p>총 기간 일수: {result.total_days}일</p>
+        <p>1/3 기준: {result.threshold:.1f}일</p>
+        <p>근무일 수: {result.worked_days}일</p>
+        <p>{condition1_text}</p>
+        <p>{condition2_text}</p>
+        {f"<p>{next_possible1_message}</p>" if next_possible1_message else ""}
+        {f"<p>{next_possible2_message}</p>" if next_possible2_message else ""}
+        <h3>📌 기준 날짜({base}) 기준 최종 판단</h3>
+        <p>✅ 일반일용근로자: {general_worker_text}</p>
+        <p>✅ 건설일용근로자: {construction_worker_text}</p>
+        {NOTICE}
+    """)
+
+
+_TIMELINE_STATUS = {
+    (True, True): ("both", "일반·건설 모두 신청 가능"),
+    (True, False): ("general", "일반일용근로자만 신청 가능"),
+    (False, True): ("construction", "건설일용근로자만 신청 가능"),
+    (False, False): ("none", "신청 불가능"),
+}
+
+
+@lru_cache(maxsize=256)
+def render_timeline_html(timeline):
+    """
+    eligibility_timeline 결과 -> 날짜별 색 띠 HTML
+    칸에 마우스를 올리면 그날 신청 시 조건 1/2 결과가 보입니다.
+    """
+    if not timeline:
+        return ""
+    cells = []
+    for day, cond1, cond2 in timeline:
+        cls, label = _TIMELINE_STATUS[cond1, cond2]
+        month_start = " month-start" if day.day == 1 else ""
+        closed = "" if is_business_day(day) else f" [{holiday_name(day) or '주말'}]"
+        title = f"{day}{closed} - {label} (조건 1 {'✅' if cond1 else '❌'}, 조건 2 {'✅' if cond2 else '❌'})"
+        cells.append(f'<span class="timeline-day {cls}{month_start}" title="{title}"></span>')
+    legend = "".join(
+        f'<span class="timeline-legend"><span class="timeline-day {cls}"></span>{label}</span>'
+        for cls, label in _TIMELINE_STATUS.values()
+    )
+    first, last = timeline[0][0], timeline[-1][0]
+    return (
+        f"<h3>📌 신청일별 가능 여부 ({first} ~ {last})</h3>"
+        f'<div class="timeline-strip">{"".join(cells)}</div>'
+        f'<div class="timeline-range"><span>{first}</span><span>{last}</span></div>'
+        f'<div class="timeline-legends">{legend}</div>'
+        "<p>※ 이후 근로제공이 없다는 전제입니다. 칸에 마우스를 올리면 날짜별 결과가 표시됩니다.</p>"
+    )
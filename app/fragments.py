@@ -0,0 +1,13 @@
+import streamlit as st
+from streamlit.errors import StreamlitAPIException
+
+
+def rerun_fragment():
+    """
+    현재 프래그먼트(@st.fragment)만 다시 실행합니다.
+    전체 실행 중이라 프래그먼트 단위 재실행이 허용되지 않으면 전체를 다시 실행합니다.
+    """
+    try:
+        st.rerun(scope="fragment")
+    except StreamlitAPIException:
+        st.rerun()
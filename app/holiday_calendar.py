@@ -0,0 +1,174 @@
+"""
+한국 공휴일 / 영업일 (오프라인 표, streamlit 비의존)
+
+HOLIDAYS 표(대체공휴일·임시공휴일·선거일 포함)를 import 시점에 날짜 서수 기준 비트셋과
+누적합으로 바꿔 두어 is_holiday / is_business_day는 O(1),
+기간 안의 영업일 수는 배열 길이와 상관없이 O(1)(NumPy 배열이면 한 번에)로 계산합니다.
+표 범위(HOLIDAY_YEARS) 밖의 날짜는 주말만 휴일로 봅니다. 매년 정부 발표에 맞춰 표를 갱신해 주세요.
+"""
+from datetime import date, timedelta
+from itertools import accumulate
+
+HOLIDAYS = {
+    # 2024
+    "2024-01-01": "신정",
+    "2024-02-09": "설날 연휴",
+    "2024-02-10": "설날",
+    "2024-02-11": "설날 연휴",
+    "2024-02-12": "대체공휴일(설날)",
+    "2024-03-01": "삼일절",
+    "2024-04-10": "국회의원 선거일",
+    "2024-05-05": "어린이날",
+    "2024-05-06": "대체공휴일(어린이날)",
+    "2024-05-15": "부처님오신날",
+    "2024-06-06": "현충일",
+    "2024-08-15": "광복절",
+    "2024-09-16": "추석 연휴",
+    "2024-09-17": "추석",
+    "2024-09-18": "추석 연휴",
+    "2024-10-01": "임시공휴일(국군의 날)",
+    "2024-10-03": "개천절",
+    "2024-10-09": "한글날",
+    "2024-12-25": "성탄절",
+    # 2025
+    "2025-01-01": "신정",
+    "2025-01-27": "임시공휴일",
+    "2025-01-28": "설날 연휴",
+    "2025-01-29": "설날",
+    "2025-01-30": "설날 연휴",
+    "2025-03-01": "삼일절",
+    "2025-03-03": "대체공휴일(삼일절)",
+    "2025-05-05": "어린이날·부처님오신날",
+    "2025-05-06": "대체공휴일(어린이날·부처님오신날)",
+    "2025-06-03": "대통령 선거일",
+    "2025-06-06": "현충일",
+    "2025-08-15": "광복절",
+    "2025-10-03": "개천절",
+    "2025-10-05": "추석 연휴",
+    "2025-10-06": "추석",
+    "2025-10-07": "추석 연휴",
+    "2025-10-08": "대체공휴일(추석)",
+    "2025-10-09": "한글날",
+    "2025-12-25": "성탄절",
+    # 2026
+    "2026-01-01": "신정",
+    "2026-02-16": "설날 연휴",
+    "2026-02-17": "설날",
+    "2026-02-18": "설날 연휴",
+    "2026-03-01": "삼일절",
+    "2026-03-02": "대체공휴일(삼일절)",
+    "2026-05-05": "어린이날",
+    "2026-05-24": "부처님오신날",
+    "2026-05-25": "대체공휴일(부처님오신날)",
+    "2026-06-03": "전국동시지방선거일",
+    "2026-06-06": "현충일",
+    "2026-08-15": "광복절",
+    "2026-08-17": "대체공휴일(광복절)",
+    "2026-09-24": "추석 연휴",
+    "2026-09-25": "추석",
+    "2026-09-26": "추석 연휴",
+    "2026-10-03": "개천절",
+    "2026-10-05": "대체공휴일(개천절)",
+    "2026-10-09": "한글날",
+    "2026-12-25": "성탄절",
+    # 2027
+    "2027-01-01": "신정",
+    "2027-02-06": "설날 연휴",
+    "2027-02-07": "설날",
+    "2027-02-08": "설날 연휴",
+    "2027-02-09": "대체공휴일(설날)",
+    "2027-03-01": "삼일절",
+    "2027-05-05": "어린이날",
+    "2027-05-13": "부처님오신날",
+    "2027-06-06": "현충일",
+    "2027-08-15": "광복절",
+    "2027-08-16": "대체공휴일(광복절)",
+    "2027-09-14": "추석 연휴",
+    "2027-09-15": "추석",
+    "2027-09-16": "추석 연휴",
+    "2027-10-03": "개천절",
+    "2027-10-04": "대체공휴일(개천절)",
+    "2027-10-09": "한글날",
+    "2027-10-11": "대체공휴일(한글날)",
+    "2027-12-25": "성탄절",
+    "2027-12-27": "대체공휴일(성탄절)",
+}
+
+HOLIDAY_YEARS = (2024, 2027)
+
+# --- import 시점에 비트셋/누적합으로 컴파일 ---
+_FIRST = date(HOLIDAY_YEARS[0], 1, 1).toordinal()
+_LAST = date(HOLIDAY_YEARS[1], 12, 31).toordinal()
+_HOLIDAY_BITS = bytearray(_LAST - _FIRST + 1)
+for _day in HOLIDAYS:
+    _HOLIDAY_BITS[date.fromisoformat(_day).toordinal() - _FIRST] = 1
+# _WEEKDAY_HOLIDAYS[i] = 표 시작부터 i일 동안 평일에 걸친 공휴일 수 (주말과 겹치는 공휴일은 영업일 수에 영향 없음)
+_WEEKDAY_HOLIDAYS = list(
+    accumulate((bit and (_FIRST + i - 1) % 7 < 5 for i, bit in enumerate(_HOLIDAY_BITS)), initial=0)
+)
+
+
+def _ordinal(day):
+    return day if isinstance(day, int) else day.toordinal()
+
+
+def is_holiday(day):
+    """공휴일(대체·임시공휴일, 선거일 포함) 여부 - 주말은 포함하지 않음"""
+    o = _ordinal(day)
+    return _FIRST <= o <= _LAST and _HOLIDAY_BITS[o - _FIRST] == 1
+
+
+def holiday_name(day):
+    """공휴일 이름 (공휴일이 아니면 None)"""
+    return HOLIDAYS.get(day.isoformat()) if is_holiday(day) else None
+
+
+def is_business_day(day):
+    """영업일(주말·공휴일이 아닌 날) 여부"""
+    o = _ordinal(day)
+    return (o - 1) % 7 < 5 and not is_holiday(o)
+
+
+def _weekdays_through(o):
+    # 서수 1(월요일)부터 o까지의 평일 수
+    return o // 7 * 5 + min(o % 7, 5)
+
+
+def _table_index(o):
+    return min(max(o - _FIRST, 0), len(_HOLIDAY_BITS))
+
+
+def business_days_between(start, end):
+    """start~end(양 끝 포함) 영업일 수, end가 앞서면 0 - O(1)"""
+    a, b = _ordinal(start), _ordinal(end)
+    if b < a:
+        return 0
+    weekdays = _weekdays_through(b) - _weekdays_through(a - 1)
+    return weekdays - (_WEEKDAY_HOLIDAYS[_table_index(b + 1)] - _WEEKDAY_HOLIDAYS[_table_index(a)])
+
+
+def business_day_counts(starts, ends):
+    """
+    시작/끝 날짜 서수 배열 -> 구간별 영업일 수 배열 (business_days_between과 같은 결과, numpy 필요)
+    """
+    import numpy as np
+
+    a = np.asarray(starts, dtype=np.int64)
+    b = np.asarray(ends, dtype=np.int64)
+    prefix = np.asarray(_WEEKDAY_HOLIDAYS, dtype=np.int64)
+
+    def weekdays_through(o):
+        return o // 7 * 5 + np.minimum(o % 7, 5)
+
+    def table_index(o):
+        return np.clip(o - _FIRST, 0, len(_HOLIDAY_BITS))
+
+    counts = (weekdays_through(b) - weekdays_through(a - 1)) - (prefix[table_index(b + 1)] - prefix[table_index(a)])
+    return np.where(b < a, 0, counts)
+
+
+def next_business_day(day):
+    """day 당일 또는 그 이후 첫 영업일"""
+    while not is_business_day(day):
+        day += timedelta(days=1)
+    return day
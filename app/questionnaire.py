@@ -0,0 +1,108 @@
+"""
+예/아니요 질문지 판단 엔진 (streamlit 없이 import 가능)
+
+app/questions.py의 질문지 정의(질문, 필요한 답, 결과 문구)를 import 시점에 한 번
+불변 판단표(Questionnaire)로 컴파일합니다. 질문마다 "필요한 답과 다르면 나올 결과"를
+미리 만들어 두므로, 판단은 답변을 앞에서부터 비교하다 처음 어긋나는 곳에서 바로 끝납니다.
+답변은 True(예) / False(아니요)로 다루고, URL(st.query_params)에는 "1"/"0" 문자열로 저장합니다.
+"""
+from dataclasses import dataclass
+from types import MappingProxyType
+
+from app.questions import QUESTIONNAIRES as _DEFINITIONS
+
+YES, NO = "예", "아니요"
+
+
+def answer_text(answer):
+    return YES if answer else NO
+
+
+def encode_answers(answers):
+    """[True, False, ...] -> 답변 문자열 "10..." """
+    return "".join("1" if a else "0" for a in answers)
+
+
+def decode_answers(token, limit):
+    """답변 문자열 "10..." -> [True, False, ...] ("0"/"1" 외의 문자가 있거나 limit자보다 길면 ValueError)"""
+    if len(token) > limit or token.strip("01"):
+        raise ValueError(f"잘못된 답변 문자열: {token!r}")
+    return [c == "1" for c in token]
+
+
+@dataclass(frozen=True, slots=True)
+class Outcome:
+    """
+    판단 결과
+    - mismatch: (질문 번호(1부터), 질문, 답, 필요한 답) - 충족이면 None
+    """
+
+    eligible: bool
+    message: str
+    info: str | None = None
+    mismatch: tuple | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class Questionnaire:
+    """
+    컴파일된 질문지
+    - required[i]: i번 질문에 필요한 답 (True/False, 결과에 영향이 없는 안내용 질문은 None)
+    - failed_at[i]: i번 질문의 답이 필요한 답과 다를 때의 결과 (미리 생성)
+    """
+
+    name: str
+    questions: tuple
+    required: tuple
+    failed_at: tuple
+    passed: Outcome
+
+    def __len__(self):
+        return len(self.questions)
+
+    def outcome(self, answers):
+        """
+        앞에서부터 받은 답변 -> Outcome
+        처음 어긋난 답에서 바로 불충족, 끝까지 답하기 전에 결과가 정해지지 않았으면 None
+        답변 중간의 None(아직 답하지 않음)에서도 멈춥니다.
+        """
+        for required, failed, answer in zip(self.required, self.failed_at, answers):
+            if answer is None:
+                return None
+            if required is not None and answer != required:
+                return failed
+        if len(answers) < len(self.questions):
+            return None
+        return self.passed
+
+
+def compile_questionnaire(name, definition):
+    """질문지 정의(dict) -> Questionnaire"""
+    texts = []
+    required = []
+    for text, needed in definition["questions"]:
+        if needed not in (YES, NO, None):
+            raise ValueError(f"{name}: 필요한 답은 '{YES}', '{NO}' 또는 None이어야 합니다: {needed!r}")
+        texts.append(text)
+        required.append(None if needed is None else needed == YES)
+    failed_at = tuple(
+        None if needed is None else Outcome(
+            eligible=False,
+            message=definition["failed"],
+            info=definition["failed_info"],
+            mismatch=(i, text, answer_text(not needed), answer_text(needed)),
+        )
+        for i, (text, needed) in enumerate(zip(texts, required), start=1)
+    )
+    return Questionnaire(
+        name=name,
+        questions=tuple(texts),
+        required=tuple(required),
+        failed_at=failed_at,
+        passed=Outcome(eligible=True, message=definition["passed"]),
+    )
+
+
+QUESTIONNAIRES = MappingProxyType(
+    {name: compile_questionnaire(name, definition) for name, definition in _DEFINITIONS.items()}
+)
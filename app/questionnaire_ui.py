@@ -0,0 +1,87 @@
+"""
+예/아니요 질문지 공통 화면 (판단은 app/questionnaire.py의 컴파일된 질문지)
+
+- 한 문항씩(기본, 작은 화면용): 답을 고를 때마다 다음 질문, 결과가 정해지면 남은 질문은 묻지 않음
+  진행 상황은 서버 세션이 아니라 URL(st.query_params)에 "1"/"0" 문자열로 저장하므로
+  다시 접속하거나 서버가 재시작되어도 이어서 진행됩니다.
+- 한 화면에 모두: st.form 하나로 받아 제출할 때 한 번만 실행해 판단
+"""
+import streamlit as st
+
+from app.fragments import rerun_fragment
+from app.questionnaire import NO, YES, decode_answers, encode_answers
+
+YES_NO = [YES, NO]
+
+
+def one_page_mode(key):
+    """모든 질문을 한 화면에 볼지 여부 (끄면 기존처럼 한 문항씩)"""
+    return st.toggle("📄 모든 질문을 한 화면에 보기 (끄면 한 문항씩)", key=key)
+
+
+def show_outcome(outcome):
+    if outcome.eligible:
+        st.success(outcome.message)
+        return
+    st.warning(outcome.message)
+    if outcome.mismatch is not None:
+        i, q, a, r = outcome.mismatch
+        st.write(f"- Q{i}: {q} (답변: {a} / 필요: {r})")
+    if outcome.info:
+        st.info(outcome.info)
+
+
+def questionnaire_form(key, questionnaire):
+    """
+    질문 전체를 한 폼으로 표시 -> 제출 시 Outcome (제출 전이면 None)
+    앞의 답만으로 결과가 정해지면 뒤의 빈 답은 묻지 않습니다.
+    """
+    with st.form(key):
+        answers = [
+            st.radio(f"**Q{i}. {q}**", YES_NO, index=None, horizontal=True, key=f"{key}_{i}")
+            for i, q in enumerate(questionnaire.questions, start=1)
+        ]
+        submitted = st.form_submit_button("✅ 결과 보기")
+    if not submitted:
+        return None
+    outcome = questionnaire.outcome([None if a is None else a == YES for a in answers])
+    if outcome is None:
+        missing = [str(i) for i, a in enumerate(answers, start=1) if a is None]
+        st.warning(f"답하지 않은 질문이 있습니다: Q{', Q'.join(missing)}")
+    return outcome
+
+
+def save_answers(param, token):
+    """진행 상황을 URL에 기록 (빈 값이면 파라미터 삭제)"""
+    if token:
+        st.query_params[param] = token
+    elif param in st.query_params:
+        del st.query_params[param]
+
+
+def reset_answers(param):
+    save_answers(param, "")
+
+
+def questionnaire_steps(param, questionnaire, prefix=""):
+    """
+    한 문항씩 묻고 결과가 정해지면 바로 표시
+    답변은 st.query_params[param]에 prefix 뒤로 이어서 저장합니다 (예: ?wage=101).
+    """
+    try:
+        answers = decode_answers(st.query_params.get(param, "")[len(prefix):], len(questionnaire))
+    except ValueError:
+        # 손으로 고친 주소 등 읽을 수 없는 값이면 처음 질문부터
+        answers = []
+        save_answers(param, prefix)
+    outcome = questionnaire.outcome(answers)
+    if outcome is not None:
+        show_outcome(outcome)
+        return
+
+    step = len(answers)
+    st.write(f"**Q{step + 1}. {questionnaire.questions[step]}**")
+    ans = st.radio("선택하세요", YES_NO, key=f"{param}_q{step + 1}")
+    if st.button("➡️ 다음", key=f"{param}_next_{step + 1}"):
+        save_answers(param, prefix + encode_answers(answers + [ans == YES]))
+        rerun_fragment()
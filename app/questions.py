@@ -1,44 +1,79 @@
+# 질문지 정의 (app/questionnaire.py가 import 시점에 판단표로 컴파일)
+# - questions: (질문, 필요한 답) - 필요한 답과 다르면 더 묻지 않고 바로 불충족,
+#   필요한 답이 None이면 결과에 영향이 없는 안내용 질문
+# - passed / failed: 결과 문구, failed_info: 불충족일 때 덧붙이는 안내 (없으면 None)
+QUESTIONNAIRES = {
+    "early_employment": {
+        "questions": [
+            ("14일 대기기간 이후에 새 일자리에 취업을 했나요?", "예"),
+            ("실업급여를 받을 수 있는 기간(소정급여일수)의 절반 이상이 남아 있나요?", "예"),
+            ("단절없이 12개월 이상 계속해서 일을 했나요?", "예"),
+            ("사업장이 바뀌었다면, 단절 없이 12개월 이상 계속 근무했나요?", "예"),
+            ("이전에 일했던 마지막 회사에 재고용 되거나 관련 사업주(합병, 사업 양도 등)에 다시 채용되었나요?", "아니요"),
+            ("실업급여 신청 전에 이미 채용이 확정되었나요?", "아니요"),
+            ("최근 2년 안에 조기재취업수당을 받은 적이 있나요?", "아니요"),
+            ("실업급여를 부정한 방법으로 받으려 했나요?", "아니요"),
+            ("현재 월급(세전)이 5,740,000원을 초과하나요?", "아니요"),
+            ("국가 또는 지방 공무원으로 임용되었나요?", "아니요"),
+        ],
+        "passed": "✅ 모든 조건을 충족했습니다.\n고용센터에 문의하여 청구를 진행하세요.",
+        "failed": "❌ 아래 조건이 충족되지 않았습니다:",
+        "failed_info": "위 조건에 대해 고용센터에 추가 문의가 필요할 수 있습니다.",
+    },
+    "early_self_employment": {
+        "questions": [
+            ("14일 대기기간 이후에 사업을 시작했나요?", "예"),
+            ("실업급여를 받을 수 있는 기간(소정급여일수)의 절반 이상이 남아 있나요?", "예"),
+            ("12개월 이상 계속해서 사업을 영위했나요?", "예"),
+            ("최근 2년 안에 조기재취업수당을 받은 적이 있나요?", "아니요"),
+            ("실업급여를 부정한 방법으로 받으려 했나요?", "아니요"),
+        ],
+        "passed": "✅ 모든 조건을 충족했습니다.\n고용센터에 문의하여 청구를 진행하세요.",
+        "failed": "❌ 아래 조건이 충족되지 않았습니다:",
+        "failed_info": "위 조건에 대해 고용센터에 추가 문의가 필요할 수 있습니다.",
+    },
+    "remote_assignment": {
+        "questions": [
+            ("통근시간이 출퇴근 합산 3시간 이상 소요되었나요?", "예"),
+            ("원거리 발령 확인서, 발령장 등 서류를 제출할 수 있나요?", None),
+            ("교통카드 사용 내역을 제출할 수 있나요? (해당 없으면 예)", None),
+            ("자차 증빙 자료를 제출할 수 있나요? (해당 없으면 예)", None),
+            ("통근 차량 노선표를 제출할 수 있나요? (해당 없으면 예)", None),
+            ("기숙사 이용 불가 사유를 제출할 수 있나요? (해당 없으면 예)", None),
+        ],
+        "passed": "✅ 조건 충족 가능. 서류 지참 후 고용센터 방문하여 판단 받으세요.",
+        "failed": "❌ 통근시간 조건 불충족으로 지급 불가",
+        "failed_info": None,
+    },
+    "wage_delay": {
+        "questions": [
+            ("임금 체불로 인해 자발적 퇴사를 하였나요?", "예"),
+            ("사업주에게 체불 사실을 명확히 요구했으나 해결되지 않았나요?", None),
+            ("근로계약서, 급여명세서, 통장사본(급여 이체 내역) 등 체불 입증 자료를 보유하고 있나요?", "예"),
+            ("관할 고용노동청에 진정을 제기했거나, 진정 계획이 있나요?", None),
+            ("임금체불 사업주 확인서 요청 가능 하나요?", None),
+        ],
+        "passed": "✅ 실업급여 수급 가능성이 있습니다.\n체불 입증 자료와 함께 고용센터에 방문하여 구체적인 상담을 받으시기 바라니다.",
+        "failed": "❌ 수급 요건이 부족할 수 있습니다.\n임금 체불을 명확히 입증하거나 추가 상담 필요.",
+        "failed_info": None,
+    },
+}
+
+def _question_texts(name):
+    return [text for text, _ in QUESTIONNAIRES[name]["questions"]]
+
 def get_employment_questions():
-    return [
-        "14일 대기기간 이후에 새 일자리에 취업을 했나요?",
-        "실업급여를 받을 수 있는 기간(소정급여일수)의 절반 이상이 남아 있나요?",
-        "단절없이 12개월 이상 계속해서 일을 했나요?",
-        "사업장이 바뀌었다면, 단절 없이 12개월 이상 계속 근무했나요?",
-        "이전에 일했던 마지막 회사에 재고용 되거나 관련 사업주(합병, 사업 양도 등)에 다시 채용되었나요?",
-        "실업급여 신청 전에 이미 채용이 확정되었나요?",
-        "최근 2년 안에 조기재취업수당을 받은 적이 있나요?",
-        "실업급여를 부정한 방법으로 받으려 했나요?",
-        "현재 월급(세전)이 5,740,000원을 초과하나요?",
-        "국가 또는 지방 공무원으로 임용되었나요?"
-    ]
+    return _question_texts("early_employment")
 
 def get_self_employment_questions():
-    return [
-        "14일 대기기간 이후에 사업을 시작했나요?",
-        "실업급여를 받을 수 있는 기간(소정급여일수)의 절반 이상이 남아 있나요?",
-        "12개월 이상 계속해서 사업을 영위했나요?",
-        "최근 2년 안에 조기재취업수당을 받은 적이 있나요?",
-        "실업급여를 부정한 방법으로 받으려 했나요?"
-    ]
+    return _question_texts("early_self_employment")
 
 def get_remote_assignment_questions():
-    return [
-        "통근시간이 출퇴근 합산 3시간 이상 소요되었나요?",
-        "원거리 발령 확인서, 발령장 등 서류를 제출할 수 있나요?",
-        "교통카드 사용 내역을 제출할 수 있나요? (해당 없으면 예)",
-        "자차 증빙 자료를 제출할 수 있나요? (해당 없으면 예)",
-        "통근 차량 노선표를 제출할 수 있나요? (해당 없으면 예)",
-        "기숙사 이용 불가 사유를 제출할 수 있나요? (해당 없으면 예)"
-    ]
+    return _question_texts("remote_assignment")
 
 def get_wage_delay_questions():
-    return [
-        "임금 체불로 인해 자발적 퇴사를 하였나요?",
-        "사업주에게 체불 사실을 명확히 요구했으나 해결되지 않았나요?",
-        "근로계약서, 급여명세서, 통장사본(급여 이체 내역) 등 체불 입증 자료를 보유하고 있나요?",
-        "관할 고용노동청에 진정을 제기했거나, 진정 계획이 있나요?",
-        "임금체불 사업주 확인서 요청 가능 하나요?",
-    ]
+    return _question_texts("wage_delay")
+
 def get_daily_worker_eligibility_questions():
     """
     일용근로자 수급자격 모의계산 관련 질문 리스트를 반환합니다.
@@ -1,10 +1,10 @@
 import streamlit as st
-import pandas as pd
+
+from app.assets import inject_styles
 
 def realjob_application_app():
-    # CSS 스타일 적용
-    with open("static/styles.css") as f:
-        st.markdown(f"<style>{f.read()}</style>", unsafe_allow_html=True)
+    # CSS 스타일 적용 (공통 스타일시트 묶음)
+    inject_styles()
 
     st.markdown("""
         <h3 style='color: #333333;'>
@@ -82,6 +82,8 @@ def realjob_application_app():
             }
             file_data.append(file_info)
 
+        import pandas as pd  # 파일이 업로드된 경우에만 필요
+
         df = pd.DataFrame(file_data)
         st.table(df)
 
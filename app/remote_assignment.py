@@ -1,30 +1,24 @@
 import streamlit as st
-from app.questions import get_remote_assignment_questions
+from app.fragments import rerun_fragment
+from app.questionnaire import QUESTIONNAIRES
+from app.questionnaire_ui import one_page_mode, questionnaire_form, questionnaire_steps, reset_answers, show_outcome
 
+# 답을 고를 때마다 이 질문 화면만 다시 실행 (main.py의 스타일/메뉴/안내문은 건너뜀)
+@st.fragment
 def remote_assignment_app():
 #    st.subheader("🟠 원거리 발령에 따른 판단")
-    questions = get_remote_assignment_questions()
+    questionnaire = QUESTIONNAIRES["remote_assignment"]
 
-    if "remote_step" not in st.session_state:
-        st.session_state.remote_step = 0
-        st.session_state.remote_answers = []
+    # 한 화면 모드: 모든 답을 한 번에 제출해 한 번의 실행으로 판단
+    if one_page_mode("remote_one_page"):
+        outcome = questionnaire_form("remote_form", questionnaire)
+        if outcome is not None:
+            show_outcome(outcome)
+        return
 
-    if st.session_state.remote_step < len(questions):
-        q = questions[st.session_state.remote_step]
-        st.write(f"**Q{st.session_state.remote_step + 1}. {q}**")
-        ans = st.radio("답변", ["예", "아니요"], key=f"remote_{st.session_state.remote_step}")
-        if st.button("다음", key=f"next_remote_{st.session_state.remote_step}"):
-            st.session_state.remote_answers.append(ans)
-            if st.session_state.remote_step == 0 and ans == "아니요":
-                st.warning("❌ 통근시간 조건 불충족으로 지급 불가")
-                st.session_state.remote_step = len(questions)
-            else:
-                st.session_state.remote_step += 1
-            st.rerun()
-    else:
-        st.success("✅ 조건 충족 가능. 서류 지참 후 고용센터 방문하여 판단 받으세요.")
+    # Q1(통근시간)이 '아니요'면 남은 질문 없이 바로 결과
+    questionnaire_steps("remote", questionnaire)
 
     if st.button("처음으로", key="reset_remote"):
-        st.session_state.remote_step = 0
-        st.session_state.remote_answers = []
-        st.rerun()
+        reset_answers("remote")
+        rerun_fragment()
@@ -1,30 +1,24 @@
 import streamlit as st
-from app.questions import get_wage_delay_questions
+from app.fragments import rerun_fragment
+from app.questionnaire import QUESTIONNAIRES
+from app.questionnaire_ui import one_page_mode, questionnaire_form, questionnaire_steps, reset_answers, show_outcome
 
+# 답을 고를 때마다 이 질문 화면만 다시 실행 (main.py의 스타일/메뉴/안내문은 건너뜀)
+@st.fragment
 def wage_delay_app():
 #    st.subheader("🔴 임금 체불에 의한 판단")
-    questions = get_wage_delay_questions()
+    questionnaire = QUESTIONNAIRES["wage_delay"]
 
-    if "wage_step" not in st.session_state:
-        st.session_state.wage_step = 0
-        st.session_state.wage_answers = []
+    # 한 화면 모드: 모든 답을 한 번에 제출해 한 번의 실행으로 판단
+    if one_page_mode("wage_one_page"):
+        outcome = questionnaire_form("wage_form", questionnaire)
+        if outcome is not None:
+            show_outcome(outcome)
+        return
 
-    if st.session_state.wage_step < len(questions):
-        q = questions[st.session_state.wage_step]
-        st.write(f"**Q{st.session_state.wage_step + 1}. {q}**")
-        ans = st.radio("답변", ["예", "아니요"], key=f"wage_{st.session_state.wage_step}")
-        if st.button("다음", key=f"next_wage_{st.session_state.wage_step}"):
-            st.session_state.wage_answers.append(ans)
-            if (st.session_state.wage_step == 0 or st.session_state.wage_step == 2) and ans == "아니요":
-                st.warning("❌ 수급 요건이 부족할 수 있습니다.\n임금 체불을 명확히 입증하거나 추가 상담 필요.")
-                st.session_state.wage_step = len(questions)
-            else:
-                st.session_state.wage_step += 1
-            st.rerun()
-    else:
-        st.success("✅ 실업급여 수급 가능성이 있습니다.\n체불 입증 자료와 함께 고용센터에 방문하여 구체적인 상담을 받으시기 바라니다.")
+    # Q1 또는 Q3이 '아니요'면 남은 질문 없이 바로 결과
+    questionnaire_steps("wage", questionnaire)
 
     if st.button("처음으로", key="reset_wage"):
-        st.session_state.wage_step = 0
-        st.session_state.wage_answers = []
-        st.rerun()
+        reset_answers("wage")
+        rerun_fragment()
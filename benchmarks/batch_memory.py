@@ -0,0 +1,77 @@
+"""
+일용근로자 일괄 판단(app.batch)의 최대 메모리 측정
+
+합성 근무 기록 CSV(근로자 ID 순, 행 수 지정)를 만들고
+`python -m app.batch daily-worker`를 별도 프로세스로 실행해 최대 RSS를 잽니다.
+행 수를 늘려도 최대 메모리가 거의 같아야 합니다 (--sort는 SORT_CHUNK_ROWS에 비례).
+
+실행: python benchmarks/batch_memory.py [행 수 ...] [--sort] [--jobs N]
+기본 행 수: 1,000,000 / 10,000,000 (1천만 행 파일은 약 190MB, 생성에 수십 초)
+"""
+import argparse
+import os
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+ROOT = os.path.join(os.path.dirname(__file__), "..")
+BASE_DATE = date(2025, 3, 10)
+DAYS = 365
+
+
+def write_synthetic_csv(path, rows, shuffle_workers=False):
+    """근로자당 1년 중 무작위 근무일 (근로자 ID 순, shuffle_workers면 근로자 순서만 섞음)"""
+    rng = random.Random(0)
+    days = [(BASE_DATE - timedelta(days=i)).isoformat() for i in range(DAYS - 1, -1, -1)]
+    workers = range(rows // 120 + 1)
+    if shuffle_workers:
+        workers = rng.sample(workers, len(workers))
+    written = 0
+    with open(path, "w", newline="") as f:
+        f.write("worker_id,work_date\n")
+        for k in workers:
+            n = min(rng.randint(60, 180), rows - written)
+            worker_id = f"W{k:08d}"
+            f.writelines(f"{worker_id},{d}\n" for d in sorted(rng.sample(days, n)))
+            written += n
+            if written >= rows:
+                break
+
+
+def peak_rss_mb(args):
+    """자식 프로세스 실행 -> (최대 RSS MB, 경과 초)"""
+    t0 = time.perf_counter()
+    subprocess.run([sys.executable, *args], cwd=ROOT, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    elapsed = time.perf_counter() - t0
+    peak = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    # ru_maxrss는 자식 전체의 최댓값이므로 작은 파일부터 측정해야 증가분이 보입니다
+    return peak / 1024, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("rows", nargs="*", type=int, default=[1_000_000, 10_000_000])
+    parser.add_argument("--sort", action="store_true", help="근로자 순서를 섞고 --sort로 실행")
+    parser.add_argument("--jobs", type=int, default=1)
+    opts = parser.parse_args()
+
+    print(f"{'rows':>12}{'file MB':>10}{'peak RSS MB':>14}{'seconds':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for rows in sorted(opts.rows):
+            path = os.path.join(tmp, f"work_{rows}.csv")
+            write_synthetic_csv(path, rows, shuffle_workers=opts.sort)
+            cmd = ["-m", "app.batch", "daily-worker", path, "--base-date", BASE_DATE.isoformat(), "-j", str(opts.jobs)]
+            if opts.sort:
+                cmd.append("--sort")
+            peak, elapsed = peak_rss_mb(cmd)
+            size = os.path.getsize(path) / 2**20
+            print(f"{rows:>12,}{size:>10.0f}{peak:>14.1f}{elapsed:>10.1f}")
+            os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+일용직 달력 컴포넌트 payload 크기 비교
+
+- before: 서버가 하루마다 <div class="day" ...>를 만들어 보내던 방식
+- after: 시작일/일수/토요일·휴일 비트마스크만 보내고 브라우저가 칸을 만드는 방식
+
+실행: python benchmarks/calendar_payload.py [기준 날짜 YYYY-MM-DD]
+브라우저 쪽 그리기 시간은 개발자 도구 Performance 패널의 'calendar-render' 측정값으로 확인합니다.
+"""
+import gzip
+import json
+import os
+import sys
+import timeit
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.calendar_component import calendar_layout  # noqa: E402
+from app.date_kernel import first_day_of_prev_month  # noqa: E402
+
+
+def legacy_grid_html(start_date, end_date):
+    """변경 전 서버에서 만들던 달력 마크업 (비교용)"""
+    html = ""
+    day = start_date
+    month = None
+    while day <= end_date:
+        if day.month != month:
+            if month is not None:
+                html += "</div>"
+            month = day.month
+            html += f"<h4>{day.year}년 {day.month:02d}월</h4>"
+            html += """
+        <div class="calendar">
+            <div class="day-header sunday">일</div>
+            <div class="day-header">월</div>
+            <div class="day-header">화</div>
+            <div class="day-header">수</div>
+            <div class="day-header">목</div>
+            <div class="day-header">금</div>
+            <div class="day-header saturday">토</div>
+        """
+            html += '<div class="empty-day"></div>' * ((day.weekday() + 1) % 7)
+        wd = day.weekday()
+        extra_cls = "saturday" if wd == 5 else "sunday" if wd == 6 else ""
+        html += (
+            f'<div class="day {extra_cls}" data-date="{day:%m/%d}" data-full-date="{day:%Y-%m-%d}" '
+            f'onclick="toggleDate(this)">{day.day}</div>'
+        )
+        day += timedelta(days=1)
+    return html + "</div>"
+
+
+def main():
+    base = date.fromisoformat(sys.argv[1]) if len(sys.argv) > 1 else date.today()
+    start = first_day_of_prev_month(base)
+
+    before = legacy_grid_html(start, base).encode("utf-8")
+    after = json.dumps(calendar_layout(start, base)).encode("utf-8")
+
+    print(f"기간: {start} ~ {base} ({(base - start).days + 1}일)")
+    print(f"{'':8}{'bytes':>10}{'gzip':>10}")
+    print(f"{'before':8}{len(before):>10}{len(gzip.compress(before)):>10}")
+    print(f"{'after':8}{len(after):>10}{len(gzip.compress(after)):>10}")
+
+    n = 2000
+    t_before = timeit.timeit(lambda: legacy_grid_html(start, base), number=n) / n
+    calendar_layout.cache_clear()
+    t_after = timeit.timeit(lambda: calendar_layout.__wrapped__(start, base), number=n) / n
+    print(f"서버 생성 시간: before {t_before * 1e6:.1f}µs, after(캐시 미적용) {t_after * 1e6:.1f}µs")
+
+
+if __name__ == "__main__":
+    main()
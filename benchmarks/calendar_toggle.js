@@ -0,0 +1,75 @@
+// 달력 클릭(toggle) 1회당 지연 시간 비교
+// - rescan: 클릭마다 전체 칸을 다시 훑어 선택 목록/조건을 새로 계산 (변경 전 방식)
+// - incremental: selection_state.js의 누적 카운터 + Fenwick 트리
+//
+// 실행: node benchmarks/calendar_toggle.js [일수=365] [클릭 수=600]
+// 구간별 값은 5회 반복 측정의 중앙값입니다.
+const path = require('path');
+const { SelectionState, dayNumber } = require(path.join(__dirname, '../app/calendar_frontend/selection_state.js'));
+
+const length = Number(process.argv[2] || 365);
+const clicks = Number(process.argv[3] || 600);
+const start = dayNumber('2024-07-01');
+const base = start + length - 1;
+
+// Full-rescan version of the same summary
+function rescanSummary(selected) {
+    const days = [];
+    for (let i = 0; i < selected.length; i++) {
+        if (selected[i]) {
+            days.push(start + i);
+        }
+    }
+    const cond1Start = new Date(base * 86400000);
+    const periodStart = Math.round(Date.UTC(cond1Start.getUTCFullYear(), cond1Start.getUTCMonth() - 1, 1) / 86400000);
+    const worked = days.filter(d => d >= periodStart && d <= base).length;
+    const window14 = [];
+    for (let d = base - 14; d < base; d++) {
+        window14.push(d);
+    }
+    const noWork14 = window14.every(d => !days.includes(d));
+    const latest = days.reduce((a, b) => Math.max(a, b), -Infinity);
+    return { worked, noWork14, latest };
+}
+
+function measure(label, makeToggle) {
+    const order = [];
+    for (let i = 0; i < clicks; i++) {
+        order.push((i * 7919) % length);
+    }
+    const blockSize = Math.max(1, Math.floor(clicks / 6));
+    const runs = [];
+    for (let r = 0; r < 5; r++) {
+        const toggle = makeToggle();
+        const perBlock = [];
+        let t0 = process.hrtime.bigint();
+        for (let k = 0; k < clicks; k++) {
+            toggle(order[k]);
+            if ((k + 1) % blockSize === 0) {
+                const t1 = process.hrtime.bigint();
+                perBlock.push(Number(t1 - t0) / blockSize / 1000);
+                t0 = t1;
+            }
+        }
+        runs.push(perBlock);
+    }
+    const median = runs[0].map((_, b) => runs.map(run => run[b]).sort((x, y) => x - y)[2]);
+    console.log(`${label.padEnd(12)} µs/click by block: ${median.map(v => v.toFixed(2)).join('  ')}`);
+}
+
+// warm-up
+for (let r = 0; r < 3; r++) {
+    const s = new SelectionState(start, length);
+    for (let i = 0; i < length; i++) { s.toggle(i); s.summary(); }
+    const sel = new Uint8Array(length);
+    for (let i = 0; i < length; i++) { sel[i] ^= 1; rescanSummary(sel); }
+}
+
+measure('incremental', () => {
+    const state = new SelectionState(start, length);
+    return i => { state.toggle(i); state.summary(); };
+});
+measure('rescan', () => {
+    const selected = new Uint8Array(length);
+    return i => { selected[i] ^= 1; rescanSummary(selected); };
+});
@@ -0,0 +1,65 @@
+"""
+달력 URL 토큰(?cal=) 확인 및 인코딩/디코딩 시간
+
+무작위 기준 날짜/근무일로 encode -> decode 왕복이 같은지,
+잘못되었거나 극단적인 토큰이 모두 ValueError로 거부되는지(화면은 ValueError만 처리) 확인합니다.
+
+실행: python benchmarks/calendar_token.py [반복 횟수=20000]
+"""
+import os
+import random
+import sys
+import time
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.calendar_codec import decode_calendar_token, encode_calendar_token  # noqa: E402
+from app.date_kernel import first_day_of_prev_month  # noqa: E402
+
+INVALID_TOKENS = [
+    "",
+    "2025031",
+    "20250230",
+    "2025-03-1",
+    "20250310.!!",
+    "00010115",
+    "00010101.AQ",
+    "99991231",
+    "18991231",
+    "21000101",
+]
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    rng = random.Random(0)
+    cases = []
+    for _ in range(n):
+        base = date(1900, 3, 1) + timedelta(days=rng.randrange(72000))
+        start = first_day_of_prev_month(base)
+        length = (base - start).days + 1
+        dates = tuple(sorted((start + timedelta(days=i)).isoformat() for i in rng.sample(range(length), rng.randrange(length))))
+        cases.append((base, dates))
+
+    t0 = time.perf_counter()
+    tokens = [encode_calendar_token(base, dates) for base, dates in cases]
+    t_encode = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    decoded = [decode_calendar_token(token) for token in tokens]
+    t_decode = time.perf_counter() - t0
+    assert decoded == cases, "왕복 결과 불일치"
+
+    for token in INVALID_TOKENS:
+        try:
+            decode_calendar_token(token)
+        except ValueError:
+            continue
+        raise AssertionError(f"거부되지 않은 토큰: {token!r}")
+
+    print(f"토큰 {n:,}개 왕복 일치, 잘못된 토큰 {len(INVALID_TOKENS)}개 모두 ValueError")
+    print(f"encode {t_encode / n * 1e6:.1f} µs/개, decode {t_decode / n * 1e6:.1f} µs/개")
+
+
+if __name__ == "__main__":
+    main()
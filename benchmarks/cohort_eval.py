@@ -0,0 +1,67 @@
+"""
+근로자별 판단(app.eligibility_engine.evaluate) vs 행렬 일괄 판단(app.cohort) 비교
+
+무작위 근무 기록으로 두 방식의 결과가 모두 같은지 확인한 뒤 시간을 잽니다.
+
+실행: python benchmarks/cohort_eval.py [근로자 수=20000] [기준 날짜 YYYY-MM-DD]
+"""
+import os
+import random
+import sys
+import time
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import numpy as np  # noqa: E402
+
+from app.cohort import evaluate_cohort  # noqa: E402
+from app.date_kernel import first_day_of_prev_month  # noqa: E402
+from app.eligibility_engine import evaluate  # noqa: E402
+
+
+def best_of(fn, repeat=3):
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = fn()
+        times.append(time.perf_counter() - t0)
+    return min(times), result
+
+
+def main():
+    workers = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    base = date.fromisoformat(sys.argv[2]) if len(sys.argv) > 2 else date(2025, 3, 10)
+    start = first_day_of_prev_month(base)
+    length = (base - start).days + 1
+
+    rng = np.random.default_rng(0)
+    density = rng.choice([0.0, 0.05, 0.2, 0.35, 0.6, 0.9], size=(workers, 1))
+    matrix = rng.random((workers, length)) < density
+    # 일부는 최근에만 근무 (조건 2 불충족 + 조건 1 충족 사례)
+    recent = rng.random(workers) < 0.3
+    matrix[recent, : length - 20] = False
+    worked_dates = [[start + timedelta(days=int(i)) for i in np.flatnonzero(row)] for row in matrix]
+
+    t_engine, expected = best_of(lambda: [evaluate(dates, base) for dates in worked_dates])
+    t_cohort, cohort = best_of(lambda: evaluate_cohort(matrix, base))
+    t_results, actual = best_of(cohort.results)
+    assert actual == expected, "결과 불일치"
+
+    print(f"근로자 {workers:,}명, 기간 {start} ~ {base} ({length}일) - 결과 일치")
+    print(f"근로자별 evaluate       {t_engine * 1e3:8.1f} ms  ({t_engine / workers * 1e6:.1f} µs/명)")
+    print(f"evaluate_cohort (배열)  {t_cohort * 1e3:8.1f} ms  ({t_cohort / workers * 1e6:.2f} µs/명)")
+    print(f"  + EligibilityResult   {t_results * 1e3:8.1f} ms")
+    print(f"배열 계산 기준 {t_engine / t_cohort:.0f}배")
+
+    random.seed(0)  # 기준 날짜를 바꿔 가며 한 번 더 결과 확인
+    for _ in range(20):
+        other = base + timedelta(days=random.randrange(-200, 200))
+        s = first_day_of_prev_month(other)
+        m = rng.random((200, (other - s).days + 1)) < 0.3
+        dates = [[s + timedelta(days=int(i)) for i in np.flatnonzero(row)] for row in m]
+        assert evaluate_cohort(m, other).results() == [evaluate(d, other) for d in dates]
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+메뉴별 콜드 스타트 import 시간
+
+메뉴마다 새 파이썬 프로세스에서 streamlit을 먼저 import한 뒤
+해당 메뉴 모듈을 import하는 데 걸린 시간을 잽니다 (streamlit 자체 비용 제외).
+
+실행: python benchmarks/cold_import.py [반복 횟수=5]
+"""
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+# main.py 의 menu_functions 와 같은 진입점 + 메뉴에 없는 화면 모듈
+MODULES = {
+    "main (시작 화면)": "main",
+    "실업인정": "app.unemployment_recognition",
+    "조기재취업수당": "app.early_reemployment",
+    "일용직(건설일용포함)": "app.daily_worker_eligibility",
+    "(참고) realjob_application": "app.realjob_application",
+    "(참고) daily_worker_eligibility1": "daily_worker_eligibility1",
+}
+
+PROBE = """
+import time, importlib, streamlit
+t = time.perf_counter()
+importlib.import_module({module!r})
+print(time.perf_counter() - t)
+"""
+
+
+def measure(module, repeat):
+    times = []
+    for _ in range(repeat):
+        out = subprocess.run(
+            [sys.executable, "-c", PROBE.format(module=module)],
+            cwd=ROOT, capture_output=True, text=True,
+        )
+        if out.returncode != 0:
+            return None
+        times.append(float(out.stdout.strip().splitlines()[-1]))
+    return statistics.median(times)
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    for label, module in MODULES.items():
+        elapsed = measure(module, repeat)
+        shown = "import 실패" if elapsed is None else f"{elapsed * 1000:8.1f} ms"
+        print(f"{label:32} {shown}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+가장 빠른 신청 가능일 확인: earliest_condition1/2_date, earliest_both_conditions_date vs 하루씩 찾기
+
+탐색 시작일 앞뒤로 근무일이 흩어진 무작위 이력(탐색 범위 안에 근무일이 남아 있는 경우 포함)으로
+하루씩 condition1_met/condition2_met을 확인하는 방식과 결과가 모두 같은지 확인한 뒤
+두 방식의 조건 1 탐색 시간을 잽니다.
+
+실행: python benchmarks/earliest_dates.py [이력 수=3000]
+"""
+import os
+import random
+import sys
+import time
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.eligibility_engine import (  # noqa: E402
+    SEARCH_DAYS,
+    WorkHistory,
+    earliest_both_conditions_date,
+    earliest_condition1_date,
+    earliest_condition2_date,
+)
+
+
+def brute_force(history, start, met, limit=SEARCH_DAYS):
+    for i in range(limit):
+        day = start + timedelta(days=i)
+        if met(day):
+            return day
+    return None
+
+
+def both_met(history):
+    return lambda day: history.condition1_met(day) and history.condition2_met(day)
+
+
+def random_case(rng):
+    start = date(2024, 1, 1) + timedelta(days=rng.randrange(730))
+    # 시작일 앞 90일 ~ 뒤 400일 사이에 근무일을 몰아서/흩어서 배치
+    density = rng.choice((0.05, 0.2, 0.4, 0.7, 0.95))
+    lo, hi = rng.randint(-90, 0), rng.randint(-30, 400)
+    worked = [start + timedelta(days=i) for i in range(lo, hi) if rng.random() < density]
+    origin = None if rng.random() < 0.5 else start - timedelta(days=rng.randint(-20, 120))
+    return WorkHistory.from_dates(worked, origin=origin), start
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 3000
+    rng = random.Random(0)
+    cases = [random_case(rng) for _ in range(n)]
+
+    for history, start in cases:
+        assert earliest_condition1_date(history, start) == brute_force(history, start, history.condition1_met), start
+        assert earliest_condition2_date(history, start) == brute_force(history, start, history.condition2_met), start
+        assert earliest_both_conditions_date(history, start) == brute_force(history, start, both_met(history)), start
+
+    t0 = time.perf_counter()
+    for history, start in cases:
+        brute_force(history, start, history.condition1_met)
+    t_brute = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    for history, start in cases:
+        earliest_condition1_date(history, start)
+    t_fast = time.perf_counter() - t0
+
+    print(f"이력 {n:,}개 - 조건 1 / 조건 2 / 두 조건 모두 하루씩 찾기와 결과 일치")
+    print(f"하루씩 찾기                {t_brute / n * 1e6:8.1f} µs")
+    print(f"earliest_condition1_date  {t_fast / n * 1e6:8.1f} µs  ({t_brute / t_fast:.0f}배)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""
+클릭 한 번당 서버 CPU 시간 / 웹소켓 전송량: 전체 재실행 vs 프래그먼트(@st.fragment) 재실행
+
+streamlit 서버를 띄워 조기재취업수당 화면(?menu=3)에 웹소켓으로 접속한 뒤
+브라우저처럼 "➡️ 다음"/"🔄 처음부터 다시 시작" 버튼 클릭을 보내 질문을 끝까지 반복합니다.
+  - 전체: fragment_id 없이 재실행 요청 (프래그먼트 도입 전처럼 main.py 전체가 실행)
+  - 프래그먼트: 버튼이 속한 프래그먼트 id로 요청 (브라우저가 실제로 보내는 방식)
+CPU 시간은 서버 프로세스의 /proc/<pid>/stat (utime + stime)로 잽니다 (Linux 전용).
+
+실행: python benchmarks/fragment_rerun.py [클릭 수=60]
+"""
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import time
+
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from tornado.websocket import websocket_connect
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+QUERY = "menu=3"
+# 다음 질문 버튼이 있으면 누르고, 질문이 끝나면 처음부터 다시
+BUTTON_LABELS = ("➡️ 다음", "🔄 처음부터 다시 시작")
+_DONE = (
+    ForwardMsg.ScriptFinishedStatus.FINISHED_SUCCESSFULLY,
+    ForwardMsg.ScriptFinishedStatus.FINISHED_FRAGMENT_RUN_SUCCESSFULLY,
+)
+_TICK = os.sysconf("SC_CLK_TCK")
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def cpu_seconds(pid):
+    with open(f"/proc/{pid}/stat") as f:
+        fields = f.read().rsplit(")", 1)[1].split()
+    return (int(fields[11]) + int(fields[12])) / _TICK
+
+
+class Session:
+    def __init__(self, ws):
+        self.ws = ws
+        self.button = None  # (위젯 id, 프래그먼트 id)
+        self.query = QUERY  # 질문 진행 상황이 URL에 기록되므로 브라우저처럼 바뀐 주소를 다시 보냄
+
+    async def run(self, trigger=None, fragment_id=""):
+        """재실행 요청 하나 -> 받은 바이트 수 (스크립트 실행이 끝날 때까지)"""
+        msg = BackMsg()
+        msg.rerun_script.query_string = self.query
+        msg.rerun_script.page_script_hash = ""
+        msg.rerun_script.fragment_id = fragment_id
+        if trigger is not None:
+            state = msg.rerun_script.widget_states.widgets.add()
+            state.id = trigger
+            state.trigger_value = True
+        await self.ws.write_message(msg.SerializeToString(), binary=True)
+
+        received = 0
+        buttons = {}
+        while True:
+            data = await asyncio.wait_for(self.ws.read_message(), 30)
+            received += len(data)
+            fwd = ForwardMsg()
+            fwd.ParseFromString(data)
+            if fwd.HasField("page_info_changed"):
+                self.query = fwd.page_info_changed.query_string
+            if fwd.HasField("delta") and fwd.delta.new_element.HasField("button"):
+                element = fwd.delta.new_element.button
+                if element.label in BUTTON_LABELS:
+                    buttons[element.label] = (element.id, fwd.delta.fragment_id)
+            if fwd.HasField("script_finished"):
+                if fwd.script_finished in _DONE:
+                    break
+                buttons.clear()  # st.rerun()으로 중단된 실행의 버튼은 화면에 남지 않음
+        for label in BUTTON_LABELS:
+            if label in buttons:
+                self.button = buttons[label]
+                break
+        return received
+
+    async def click(self, fragment):
+        widget_id, fragment_id = self.button
+        return await self.run(widget_id, fragment_id if fragment else "")
+
+
+async def measure(port, pid, clicks, fragment):
+    ws = await websocket_connect(f"ws://127.0.0.1:{port}/_stcore/stream")
+    session = Session(ws)
+    await session.run()
+    await session.click(fragment)  # 첫 클릭(캐시/지연 import)은 제외
+
+    received = 0
+    cpu = cpu_seconds(pid)
+    t0 = time.perf_counter()
+    for _ in range(clicks):
+        received += await session.click(fragment)
+    elapsed = time.perf_counter() - t0
+    cpu = cpu_seconds(pid) - cpu
+    ws.close()
+    return received / clicks, cpu / clicks, elapsed / clicks
+
+
+async def wait_ready(port, proc):
+    for _ in range(300):
+        if proc.poll() is not None:
+            raise RuntimeError("streamlit 서버가 종료되었습니다")
+        try:
+            ws = await websocket_connect(f"ws://127.0.0.1:{port}/_stcore/stream")
+            ws.close()
+            return
+        except OSError:
+            await asyncio.sleep(0.1)
+    raise RuntimeError("streamlit 서버가 시작되지 않았습니다")
+
+
+async def bench(clicks):
+    port = free_port()
+    proc = subprocess.Popen(
+        [
+            sys.executable, "-m", "streamlit", "run", "main.py",
+            "--server.headless", "true",
+            "--server.port", str(port),
+            "--server.fileWatcherType", "none",
+            "--browser.gatherUsageStats", "false",
+        ],
+        cwd=ROOT,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        await wait_ready(port, proc)
+        rows = {}
+        for name, fragment in (("전체 재실행", False), ("프래그먼트", True)):
+            rows[name] = await measure(port, proc.pid, clicks, fragment)
+    finally:
+        proc.terminate()
+        proc.wait()
+
+    print(f"조기재취업수당 질문 클릭 {clicks}회 평균 (버튼 클릭 + 이어지는 st.rerun 포함)")
+    print(f"{'':12} {'웹소켓 수신':>12} {'서버 CPU':>10} {'응답 시간':>10}")
+    for name, (received, cpu, elapsed) in rows.items():
+        print(f"{name:12} {received / 1024:9.1f} KB {cpu * 1e3:7.1f} ms {elapsed * 1e3:7.1f} ms")
+    full, frag = rows["전체 재실행"], rows["프래그먼트"]
+    ratios = (full[i] / max(frag[i], 1e-9) for i in range(3))
+    print("전체 재실행 / 프래그먼트 비율: 전송량 {:.1f}, 서버 CPU {:.1f}, 응답 시간 {:.1f}".format(*ratios))
+
+
+if __name__ == "__main__":
+    asyncio.run(bench(int(sys.argv[1]) if len(sys.argv) > 1 else 60))
@@ -0,0 +1,58 @@
+"""
+영업일 수 계산 확인: business_days_between(스칼라) vs business_day_counts(NumPy) vs 하루씩 세기
+
+표 범위(HOLIDAY_YEARS) 안팎에 걸친 무작위 구간으로 세 방식의 결과가 모두 같은지 확인한 뒤
+구간 수만큼 한 번에 세는 시간을 잽니다.
+
+실행: python benchmarks/holiday_counts.py [구간 수=200000]
+"""
+import os
+import random
+import sys
+import time
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import numpy as np  # noqa: E402
+
+from app.holiday_calendar import (  # noqa: E402
+    HOLIDAY_YEARS,
+    business_day_counts,
+    business_days_between,
+    is_business_day,
+)
+
+
+def brute_force(start, end):
+    return sum(is_business_day(start + timedelta(days=i)) for i in range((end - start).days + 1))
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    rng = random.Random(0)
+    lo = date(HOLIDAY_YEARS[0] - 1, 6, 1).toordinal()
+    hi = date(HOLIDAY_YEARS[1] + 1, 6, 30).toordinal()
+    # 길이 -5 ~ 400일 (끝이 앞서는 구간 포함)
+    starts = [rng.randint(lo, hi) for _ in range(n)]
+    ends = [s + rng.randint(-5, 400) for s in starts]
+
+    for s, e in zip(starts[:3000], ends[:3000]):
+        a, b = date.fromordinal(s), date.fromordinal(e)
+        assert business_days_between(a, b) == brute_force(a, b), (a, b)
+
+    t0 = time.perf_counter()
+    scalar = [business_days_between(s, e) for s, e in zip(starts, ends)]
+    t_scalar = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    vector = business_day_counts(np.array(starts), np.array(ends))
+    t_vector = time.perf_counter() - t0
+    assert vector.tolist() == scalar, "스칼라/NumPy 결과 불일치"
+
+    print(f"구간 {n:,}개 - 하루씩 세기(3,000개) / 스칼라 / NumPy 결과 일치")
+    print(f"business_days_between  {t_scalar * 1e3:8.1f} ms")
+    print(f"business_day_counts    {t_vector * 1e3:8.1f} ms  ({t_scalar / t_vector:.0f}배)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,19 +1,16 @@
 import streamlit as st
-import pandas as pd
 from datetime import datetime, timedelta, date
-import pytz
-
-KST = pytz.timezone('Asia/Seoul')
+from app.date_kernel import date_range as kernel_date_range, first_day_of_prev_month, now_kst
+from app.eligibility_engine import WorkHistory
 
 def get_date_range(apply_date):
-    start_of_apply_month = apply_date.replace(day=1)
-    start_date = (start_of_apply_month - pd.DateOffset(months=1)).replace(day=1).date()
-    return [d.date() for d in pd.date_range(start=start_date, end=apply_date)], start_date
+    start_date = first_day_of_prev_month(apply_date)
+    return kernel_date_range(start_date, apply_date), start_date
 
 def daily_worker_eligibility_app():
     st.header("일용근로자 수급자격 요건 모의계산")
 
-    current_datetime = datetime.now(KST)
+    current_datetime = now_kst()
     st.markdown(f"**오늘:** {current_datetime.strftime('%Y-%m-%d %A %H:%M')}")
 
     st.markdown("### 📋 요건 조건")
@@ -28,8 +25,8 @@ def daily_worker_eligibility_app():
     selected_strs = st.multiselect("근무한 날짜 선택", date_options)
     selected_dates = set(datetime.strptime(s.split()[0], "%Y-%m-%d").date() for s in selected_strs)
 
-    total_days = len(date_range)
-    worked_days = len(selected_dates)
+    history = WorkHistory.from_dates(selected_dates, origin=start_date, end=apply_date)
+    worked_days, total_days = history.condition1(apply_date)
     threshold = total_days / 3
 
     cond1 = worked_days < threshold
@@ -37,11 +34,7 @@ def daily_worker_eligibility_app():
     fourteen_end = apply_date - timedelta(days=1)
     fourteen_start = fourteen_end - timedelta(days=13)
 
-    # ✅ 타입 불일치 방지: date()로 맞춤
-    worked_in_14 = any(
-        d in selected_dates for d in [dt.date() for dt in pd.date_range(fourteen_start, fourteen_end)]
-    )
-    cond2 = not worked_in_14
+    cond2 = not history.worked_within(apply_date)
 
     st.markdown("---")
     st.markdown("### ✅ 조건별 판정")
@@ -51,10 +44,12 @@ def daily_worker_eligibility_app():
         f"(총 {worked_days}일 / 기간 {total_days}일, 기준 {threshold:.1f}일)"
     )
 
-    st.markdown(
-        f"{'✅ 조건 2 충족: 신청일 직전 14일간 근무 기록이 없습니다.' if cond2 else '❌ 조건 2 불충족: 신청일 직전 14일간'
-         f'({fourteen_start} ~ {fourteen_end}) 내 근무기록이 존재합니다.'}"
+    cond2_text = (
+        "✅ 조건 2 충족: 신청일 직전 14일간 근무 기록이 없습니다."
+        if cond2
+        else f"❌ 조건 2 불충족: 신청일 직전 14일간({fourteen_start} ~ {fourteen_end}) 내 근무기록이 존재합니다."
     )
+    st.markdown(cond2_text)
 
     if not cond2:
         # 조건 2 불충족 시, 대안 제시
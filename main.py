@@ -1,16 +1,12 @@
 import streamlit as st
-import os
+import importlib
 
-# 필요한 앱 함수들만 임포트
-from app.daily_worker_eligibility import daily_worker_eligibility_app
-from app.early_reemployment import early_reemployment_app
-from app.unemployment_recognition import unemployment_recognition_app
+from app.assets import inject_styles
 
-def load_css(file_name):
-    """CSS 파일을 읽어 Streamlit에 적용"""
-    css_path = os.path.join(os.path.dirname(__file__), file_name)
-    with open(css_path, "r", encoding="utf-8") as f:
-        st.markdown(f"<style>{f.read()}</style>", unsafe_allow_html=True)
+def load_menu_app(entry_point):
+    """메뉴 진입점("모듈:함수")의 모듈을 처음 선택될 때 import해 함수를 반환"""
+    module_name, func_name = entry_point.split(":")
+    return getattr(importlib.import_module(module_name), func_name)
 
 def main():
     st.set_page_config(
@@ -19,147 +15,15 @@ def main():
         layout="centered" # 페이지 내용을 중앙에 정렬
     )
 
-    # 스타일 로드 및 상단 안내 텍스트
-    load_css("static/styles.css")
+    # 스타일 로드 (static/styles.css + static/main.css 묶음, 파일이 바뀔 때만 다시 만듦) 및 상단 안내 텍스트
+    inject_styles()
     st.markdown('<div class="custom-header">실업급여 도우미</div>', unsafe_allow_html=True)
 
-    # 모든 CSS 스타일 (오른쪽 상단 메뉴 숨기기 추가)
-    st.markdown("""
-    <style>
-    
-    /* 기존 스타일 유지 */
-    /* 콤보박스 선택 영역 (현재 선택된 값 표시되는 부분) */
-    div[data-baseweb="select"] > div:first-child {
-        border: 2px solid #2196F3 !important;
-        color: #2196F3 !important;
-        font-weight: 600 !important;
-        background-color: #E3F2FD !important;
-    }
-
-    /* 콤보박스 내부 텍스트 (현재 선택된 값) */
-    div[data-baseweb="select"] span {
-        color: #2196F3 !important;
-        font-weight: 600 !important;
-    }
-
-    /* 드롭다운 리스트 컨테이너 */
-    div[data-baseweb="popover"] {
-        z-index: 9999 !important;
-        background-color: #FFFFFF !important;
-        border: 1px solid #2196F3 !important;
-        border-radius: 8px !important;
-        box-shadow: 0 4px 12px rgba(0,0,0,0.2) !important;
-    }
-
-    /* 드롭다운 리스트 항목 */
-    div[data-baseweb="select"] ul[role="listbox"] li {
-        color: #2196F3 !important;
-        font-weight: 600 !important;
-        padding: 10px 15px !important;
-    }
-
-    /* 드롭다운 리스트 항목 호버 시 */
-    div[data-baseweb="select"] ul[role="listbox"] li:hover {
-        background-color: #2196F3 !important;
-        color: white !important;
-    }
-
-    /* 스크롤바 스타일링 */
-    div[data-baseweb="popover"]::-webkit-scrollbar {
-        width: 8px;
-    }
-    div[data-baseweb="popover"]::-webkit-scrollbar-thumb {
-        background-color: #bbdefb;
-        border-radius: 4px;
-    }
-    div[data-baseweb="popover"]::-webkit-scrollbar-track {
-        background-color: #f1f1f1;
-    }
-
-    /* 다크 모드 스타일 */
-    html[data-theme="dark"] div[data-baseweb="select"] > div:first-child {
-        background-color: #31333F !important;
-        color: #FAFAFA !important;
-        border: 2px solid #4B4B4B !important;
-    }
-    html[data-theme="dark"] div[data-baseweb="select"] span {
-        color: #FAFAFA !important;
-    }
-    html[data-theme="dark"] div[data-baseweb="popover"] {
-        background-color: #262730 !important;
-        border: 1px solid #4B4B4B !important;
-        box-shadow: 0 4px 12px rgba(0,0,0,0.4) !important;
-    }
-    html[data-theme="dark"] div[data-baseweb="select"] ul[role="listbox"] li {
-        color: #FAFAFA !important;
-    }
-    html[data-theme="dark"] div[data-baseweb="select"] ul[role="listbox"] li:hover {
-        background-color: #45475A !important;
-        color: white !important;
-    }
-
-    /* 달력 그리드 */
-    .calendar {
-        display: grid;
-        grid-template-columns: repeat(7, 1fr);
-        gap: 5px;
-        width: 100%;
-        background: #fff;
-        padding: 10px;
-        border-radius: 8px;
-    }
-
-    /* 요일 헤더 */
-    .day-header {
-        aspect-ratio: 1/1;
-        display: flex;
-        justify-content: center;
-        align-items: center;
-        border: 1px solid #ddd;
-        border-radius: 5px;
-        font-size: 14px;
-        font-weight: bold;
-        color: #333;
-    }
-    .day-header.sunday {
-        color: red;
-    }
-    .day-header.saturday {
-        color: blue;
-    }
-
-    /* 날짜 */
-    .day {
-        aspect-ratio: 1/1;
-        display: flex;
-        justify-content: center;
-        align-items: center;
-        border: 1px solid #ddd;
-        border-radius: 5px;
-        font-size: 16px;
-        color: #333;
-    }
-
-    .day.sunday {
-        color: red;
-    }
-    .day.saturday {
-        color: blue;
-    }
-
-    /* 빈칸 */
-    .day.empty {
-        border: none;
-        background: none;
-    }
-    </style>
-    """, unsafe_allow_html=True)
-
-    # 각 메뉴에 연결될 함수 매핑
+    # 각 메뉴에 연결될 함수 매핑 (선택된 메뉴의 모듈만 import)
     menu_functions = {
-        "실업인정": unemployment_recognition_app,
-        "조기재취업수당": early_reemployment_app,
-        "일용직(건설일용포함)": daily_worker_eligibility_app
+        "실업인정": "app.unemployment_recognition:unemployment_recognition_app",
+        "조기재취업수당": "app.early_reemployment:early_reemployment_app",
+        "일용직(건설일용포함)": "app.daily_worker_eligibility:daily_worker_eligibility_app"
     }
 
     # 메뉴와 표시될 텍스트 제목
@@ -191,6 +55,11 @@ def main():
         selected_menu_name = st.session_state.main_menu_select_key
         st.session_state.current_menu_idx = menus.index(selected_menu_name)
 
+        # 이전 화면의 URL 상태(달력 공유 토큰 등)는 메뉴를 바꾸면 지움
+        for param in list(st.query_params):
+            if param != "menu":
+                del st.query_params[param]
+
         if st.session_state.current_menu_idx == 0:
             if "menu" in st.query_params:
                 del st.query_params["menu"] # "메뉴 선택" 시 URL 파라미터 제거
@@ -252,7 +121,7 @@ def main():
     else:
         # 선택된 메뉴에 해당하는 함수 호출
         if selected_menu_name in menu_functions:
-            menu_functions[selected_menu_name]()
+            load_menu_app(menu_functions[selected_menu_name])()
         else:
             st.error("선택된 메뉴에 해당하는 페이지를 찾을 수 없습니다.")
             st.info("다시 메뉴를 선택해주세요.")